@@ -1,7 +1,10 @@
 from pathlib import Path
+from collections import namedtuple
+from types import MappingProxyType
 import os
 # Central configuration used by main and build-time metadata
-CONFIG_DIR = Path(os.getenv('APPDATA', Path.home())) / 'PSA_DIAG'
+# (an empty APPDATA falls back to the home directory as well)
+CONFIG_DIR = Path(os.environ.get('APPDATA') or Path.home()) / 'PSA_DIAG'
 
 # Application version (keep in sync with release tags)
 APP_VERSION = "2.3.2.0"
@@ -13,6 +16,26 @@ ARCHIVE_PASSWORD = ""
 URL_LAST_VERSION_PSADIAG = "https://psa-diag.fr/diagbox/install/last_version_psadiag.json"
 URL_VERSION_OPTIONS = "https://psa-diag.fr/diagbox/install/available_versions.json"
 URL_REMOTE_MESSAGES = "https://psa-diag.fr/diagbox/install/banner.json"
+# Aggregated {"psadiag": ..., "options": [...], "messages": [...]} served in one request
+URL_BOOTSTRAP = "https://psa-diag.fr/diagbox/install/bootstrap.json"
+
+# Local cache for the remote JSON endpoints above (TTL in seconds)
+REMOTE_CACHE_DIR = CONFIG_DIR / "remote_cache"
+TTL_LAST_VERSION_PSADIAG = 6 * 3600
+TTL_VERSION_OPTIONS = 24 * 3600
+TTL_REMOTE_MESSAGES = 15 * 60
+
+# Remote metadata endpoints as (url, ttl) keyed by the names used in main.py;
+# add an entry here to have it fetched, cached and revalidated with the others.
+EndpointSpec = namedtuple("EndpointSpec", "url ttl")
+REMOTE_ENDPOINTS = MappingProxyType({
+    "psadiag": EndpointSpec(URL_LAST_VERSION_PSADIAG, TTL_LAST_VERSION_PSADIAG),
+    "options": EndpointSpec(URL_VERSION_OPTIONS, TTL_VERSION_OPTIONS),
+    "messages": EndpointSpec(URL_REMOTE_MESSAGES, TTL_REMOTE_MESSAGES),
+})
+
+# How long to skip URL_BOOTSTRAP after the server answered 404 for it
+TTL_BOOTSTRAP_MISSING = 24 * 3600
 
 # VHD/VHDX download URL
 URL_VHD_DOWNLOAD = "https://archive.org/download/psadiag/PSA-DIAG.vhdx"
@@ -7,17 +7,39 @@ from PySide6 import QtCore, QtGui, QtWidgets #type:ignore
 import psutil #type:ignore
 import platform
 import requests #type:ignore
+from requests.adapters import HTTPAdapter #type:ignore
+from urllib3.util.retry import Retry #type:ignore
+try:
+    import httpx #type:ignore
+except ImportError:
+    httpx = None
 import os
 import time
 import shutil
+import stat
 import ctypes
+import ctypes.wintypes
 import glob
 import subprocess
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 import re
 import threading
+import collections
+import asyncio
+import hashlib
+import string
+import locale
 from datetime import datetime
 import json
+try:
+    from orjson import loads as json_loads #type:ignore
+except ImportError:
+    json_loads = json.loads
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from urllib.parse import unquote, urlsplit
 
 # Determine base path for resources.
@@ -29,26 +51,48 @@ else:
 PERSISTENT_DOWNLOAD_FOLDER = r"C:\INSTALL"
 INSTALL_ROOT = Path(PERSISTENT_DOWNLOAD_FOLDER)
 UPDATE_DIR = INSTALL_ROOT / "Update"
+UPDATE_DIR_STR = str(UPDATE_DIR)
 UPDATE_READY_FILE = UPDATE_DIR / "update.ready"
 PRIMARY_EXE_PATH = INSTALL_ROOT / "PSA_DIAG.exe"
 
 # Centralized configuration (moved to `config.py`)
 from config import CONFIG_DIR, APP_VERSION, URL_LAST_VERSION_PSADIAG, URL_VERSION_OPTIONS, URL_REMOTE_MESSAGES, ARCHIVE_PASSWORD, URL_VHD_DOWNLOAD, URL_VHD_TORRENT
+from config import REMOTE_CACHE_DIR, TTL_LAST_VERSION_PSADIAG, TTL_VERSION_OPTIONS, TTL_REMOTE_MESSAGES
+from config import URL_BOOTSTRAP, TTL_BOOTSTRAP_MISSING, REMOTE_ENDPOINTS
 
 # Translation system
+@lru_cache(maxsize=2048)
+def _resolve_translation(language, key):
+    """Walk the loaded table for `language`; returns None when `key` is missing."""
+    value = Translator._TABLES.get(language, {})
+    for k in key.split('.'):
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            return None
+    return value
+
 class Translator:
+    _TABLES = {}  # language -> parsed translations, shared with _resolve_translation
+    _TABLE_MTIMES = {}  # language -> st_mtime_ns of the file _TABLES was parsed from
+
     def __init__(self, language='en'):
         self.language = language
-        self.translations = {}
-        self.load_translations()
+        self.translations = None  # Parsed on first t() call
     
     def load_translations(self):
         """Load translation file for current language"""
         lang_file = BASE / "lang" / f"{self.language}.json"
+        self.translations = {}
         try:
-            if lang_file.exists():
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    self.translations = json.load(f)
+            mtime = lang_file.stat().st_mtime_ns if lang_file.exists() else None
+            if mtime is not None and Translator._TABLE_MTIMES.get(self.language) == mtime:
+                # Unchanged since last parse (e.g. switching back to a previous language)
+                self.translations = Translator._TABLES[self.language]
+                return
+            if mtime is not None:
+                self.translations = json_loads(lang_file.read_bytes())
+                Translator._TABLE_MTIMES[self.language] = mtime
                 # Logger may not be initialized yet during early import
                 if 'logger' in globals():
                     logger.info(f"Loaded translations for language: {self.language}")
@@ -58,19 +102,18 @@ class Translator:
         except Exception as e:
             if 'logger' in globals():
                 logger.error(f"Error loading translations: {e}")
+        Translator._TABLES[self.language] = self.translations
+        _resolve_translation.cache_clear()
     
     def t(self, key, **kwargs):
         """Translate a key with optional formatting parameters"""
-        keys = key.split('.')
-        value = self.translations
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                if 'logger' in globals():
-                    logger.warning(f"Translation key not found: {key}")
-                return key
+        if self.translations is None:
+            self.load_translations()
+        value = _resolve_translation(self.language, key)
+        if value is None:
+            if 'logger' in globals():
+                logger.warning(f"Translation key not found: {key}")
+            return key
         
         # Format with kwargs if provided
         if kwargs:
@@ -83,7 +126,8 @@ class Translator:
     def set_language(self, language):
         """Change the current language"""
         self.language = language
-        self.load_translations()
+        self.translations = None
+        _resolve_translation.cache_clear()
         self.save_language_preference()
     
     def save_language_preference(self):
@@ -96,22 +140,21 @@ class Translator:
         except Exception as e:
             if 'logger' in globals():
                 logger.error(f"Failed to save language preference: {e}")
-    
-    def load_language_preference(self):
-        """Load language preference from file"""
-        try:
-            prefs_file = CONFIG_DIR / "preferences.json"
-            if prefs_file.exists():
-                with open(prefs_file, 'r', encoding='utf-8') as f:
-                    prefs = json.load(f)
-                    return prefs.get('language', 'fr')
-        except Exception as e:
-            if 'logger' in globals():
-                logger.error(f"Failed to load language preference: {e}")
-        return 'fr'  # Default to French
+
+def load_language_preference():
+    """Load language preference from file"""
+    try:
+        prefs_file = CONFIG_DIR / "preferences.json"
+        if prefs_file.exists():
+            prefs = json_loads(prefs_file.read_bytes())
+            return prefs.get('language', 'fr')
+    except Exception as e:
+        if 'logger' in globals():
+            logger.error(f"Failed to load language preference: {e}")
+    return 'fr'  # Default to French
 
 # Global translator instance
-translator = Translator(Translator('en').load_language_preference())  # Load saved preference
+translator = Translator(load_language_preference())  # Load saved preference
 
 # Configure logging
 # Always write logs to the persistent config directory so the executable
@@ -121,11 +164,21 @@ log_folder = CONFIG_DIR / "logs"
 log_folder.mkdir(parents=True, exist_ok=True)
 log_file = log_folder / f"psa_diag_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 
+# Log records are queued by the calling thread and written to disk by a background
+# QueueListener, so worker loops never block on file I/O.
+_log_file_handler = logging.FileHandler(log_file, encoding='utf-8')
+_log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_file_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(log_file, encoding='utf-8')
+        _log_queue_handler
         # StreamHandler removed - console will be integrated in UI
     ]
 )
@@ -137,25 +190,271 @@ logger.info(f"Log file path: {log_file}")
 
 class QTextEditLogger(logging.Handler):
     """Custom logging handler that writes to a QTextEdit widget"""
+    FLUSH_INTERVAL_MS = 50
+
     def __init__(self, text_edit):
         super().__init__()
         self.text_edit = text_edit
+        # Records from any thread are buffered and appended in one batch by a
+        # GUI-thread single-shot timer, armed only when the buffer goes from
+        # empty to non-empty, so an idle log causes no wake-ups.
+        self._buffer = []
+        self._flush_pending = False
+        self._timer = QtCore.QTimer(text_edit)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._timer.timeout.connect(self._flush)
     
     def emit(self, record):
-        msg = self.format(record)
-        # Use invokeMethod to ensure thread safety
-        QtCore.QMetaObject.invokeMethod(
-            self.text_edit,
-            "append",
-            QtCore.Qt.ConnectionType.QueuedConnection,
-            QtCore.Q_ARG(str, msg)
+        # Runs under self.lock (Handler.handle); the queued call is safe from any thread
+        self._buffer.append(self.format(record))
+        if not self._flush_pending:
+            self._flush_pending = True
+            QtCore.QMetaObject.invokeMethod(self._timer, "start", QtCore.Qt.ConnectionType.QueuedConnection)
+
+    def _flush(self):
+        with self.lock:
+            msgs, self._buffer = self._buffer, []
+            self._flush_pending = False
+        if msgs:
+            self.text_edit.append('\n'.join(msgs))
+
+# Shared HTTP session for the psa-diag.fr metadata endpoints (version options,
+# banner messages, app version) and the GitHub release API. Reusing one pooled
+# session avoids paying a new TCP+TLS handshake for every lookup.
+_http_session = None
+_http_session_lock = threading.Lock()
+
+# Ask the GitHub REST API for its JSON media type explicitly
+GITHUB_API_HEADERS = {'Accept': 'application/vnd.github+json'}
+
+def get_http_session():
+    """Return the process-wide pooled requests.Session (created on first use)."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                session.headers.update({'User-Agent': f'PSA-DIAG/{APP_VERSION}'})
+                retry_strategy = Retry(
+                    total=3,
+                    connect=1,  # fail fast when offline, the UI waits on these calls
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=["GET", "HEAD"],
+                )
+                adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=10)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+def close_http_session():
+    """Close the shared session's pooled connections (a new one is created on next use)."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+# Remote JSON cache: parsed entries are kept in memory and mirrored on disk
+# (REMOTE_CACHE_DIR) so a relaunch within the TTL skips the network entirely.
+_remote_json_cache = {}
+
+def _remote_cache_path(url):
+    """Return the on-disk cache file for `url`."""
+    digest = hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+    return REMOTE_CACHE_DIR / f"{digest}.json"
+
+def _load_remote_cache_entry(url):
+    """Return the cache entry for `url` from memory, falling back to disk."""
+    entry = _remote_json_cache.get(url)
+    if entry is None:
+        try:
+            with open(_remote_cache_path(url), 'rb') as f:
+                entry = json_loads(f.read())
+            entry['data'] = json_loads(entry['body'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        _remote_json_cache[url] = entry
+    return entry
+
+def _store_remote_cache_entry(url, entry):
+    """Keep `entry` in memory and persist it (without the parsed data) to disk."""
+    _remote_json_cache[url] = entry
+    try:
+        REMOTE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_remote_cache_path(url), 'w', encoding='utf-8') as f:
+            json.dump({key: value for key, value in entry.items() if key != 'data'}, f)
+    except OSError as e:
+        logger.debug(f"Failed to write remote cache for {url}: {e}")
+
+def _prepare_remote_request(url, ttl_seconds):
+    """Return (entry, headers) for `url`; headers is None when the cached entry is still fresh."""
+    entry = _load_remote_cache_entry(url)
+    if entry and time.time() - entry.get('fetched_at', 0) < ttl_seconds:
+        return entry, None
+
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return entry, headers
+
+def _apply_remote_response(url, entry, response):
+    """Update the cache from a requests/httpx response and return the decoded JSON."""
+    if response.status_code == 304 and entry:
+        entry['fetched_at'] = time.time()
+        _store_remote_cache_entry(url, entry)
+        return entry['data']
+    response.raise_for_status()
+    # Decode with json's own encoding sniffing (BOM, UTF-16/32) before handing the text
+    # to orjson, which only accepts BOM-less UTF-8
+    body = response.content.decode(json.detect_encoding(response.content)).lstrip('\ufeff')
+    data = json_loads(body)
+    _store_remote_cache_entry(url, {
+        'fetched_at': time.time(),
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'body': body,
+        'data': data,
+    })
+    return data
+
+def cached_get_json(url, ttl_seconds=3600, timeout=6):
+    """Return the decoded JSON for `url`, served from cache while younger than `ttl_seconds`.
+
+    Expired entries are revalidated with If-None-Match / If-Modified-Since so an
+    unchanged file costs a 304 instead of a full download and re-parse.
+    """
+    entry, headers = _prepare_remote_request(url, ttl_seconds)
+    if headers is None:
+        return entry['data']
+    response = get_http_session().get(url, headers=headers, timeout=timeout)
+    return _apply_remote_response(url, entry, response)
+
+async def afetch_all_remote_metadata():
+    """Fetch the stale REMOTE_ENDPOINTS over one multiplexed HTTP/2 connection (httpx)."""
+    results = {}
+    pending = {}
+    for name, spec in REMOTE_ENDPOINTS.items():
+        entry, headers = _prepare_remote_request(spec.url, spec.ttl)
+        if headers is None:
+            results[name] = entry['data']
+        else:
+            pending[name] = (spec.url, entry, headers)
+    if not pending:
+        return results
+
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=4, max_connections=10),
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        headers={'User-Agent': f'PSA-DIAG/{APP_VERSION}'},
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get(url, headers=headers) for url, _, headers in pending.values()),
+            return_exceptions=True,
         )
+    for (name, (url, entry, _)), response in zip(pending.items(), responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            results[name] = _apply_remote_response(url, entry, response)
+        except Exception as e:
+            results[name] = _as_requests_error(e)
+    return results
+
+def _as_requests_error(exc):
+    """Map an httpx error to the requests exception callers already handle; other errors pass through."""
+    if httpx is None or not isinstance(exc, httpx.HTTPError):
+        return exc
+    if isinstance(exc, httpx.HTTPStatusError):
+        response = requests.Response()
+        response.status_code = exc.response.status_code
+        response.url = str(exc.request.url)
+        converted = requests.HTTPError(str(exc), response=response)
+    elif isinstance(exc, httpx.TimeoutException):
+        converted = requests.exceptions.Timeout(str(exc))
+    elif isinstance(exc, httpx.TransportError):
+        converted = requests.exceptions.ConnectionError(str(exc))
+    else:
+        converted = requests.exceptions.RequestException(str(exc))
+    converted.__cause__ = exc
+    return converted
+
+def fetch_all_remote_metadata():
+    """Fetch the psa-diag.fr metadata endpoints concurrently.
+
+    Uses httpx over HTTP/2 when it is installed, otherwise (or if that fails as a
+    whole) the shared requests session on a thread pool.
+
+    Returns a dict keyed by logical name. Each value is either the decoded
+    JSON or the exception raised while fetching it, so callers keep their
+    own error handling (see `resolve_remote_json`).
+    """
+    if httpx is not None:
+        try:
+            return asyncio.run(afetch_all_remote_metadata())
+        except Exception as e:
+            logger.debug(f"httpx metadata fetch failed, falling back to requests: {e}")
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(REMOTE_ENDPOINTS)) as executor:
+        futures = {name: executor.submit(cached_get_json, spec.url, spec.ttl) for name, spec in REMOTE_ENDPOINTS.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+    return results
+
+def fetch_bootstrap():
+    """Fetch all remote metadata from the aggregated URL_BOOTSTRAP file.
+
+    Falls back to `fetch_all_remote_metadata` when the file is unavailable or
+    malformed. A 404 is remembered for TTL_BOOTSTRAP_MISSING so servers that do
+    not publish the file yet are not probed on every launch.
+    """
+    missing_marker = REMOTE_CACHE_DIR / "bootstrap.missing"
+    try:
+        if time.time() - missing_marker.stat().st_mtime < TTL_BOOTSTRAP_MISSING:
+            return fetch_all_remote_metadata()
+    except OSError:
+        pass
+
+    try:
+        data = cached_get_json(URL_BOOTSTRAP, TTL_REMOTE_MESSAGES, timeout=5)
+        if (isinstance(data, dict) and isinstance(data.get('psadiag'), dict)
+                and isinstance(data.get('options'), list) and isinstance(data.get('messages'), list)):
+            return {name: data[name] for name in REMOTE_ENDPOINTS}
+        logger.warning("Bootstrap metadata has an unexpected shape, using individual endpoints")
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            try:
+                REMOTE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                missing_marker.touch()
+            except OSError:
+                pass
+        logger.debug(f"Bootstrap metadata unavailable: {e}")
+    except Exception as e:
+        logger.debug(f"Bootstrap metadata unavailable: {e}")
+    return fetch_all_remote_metadata()
+
+def resolve_remote_json(prefetched, url, ttl_seconds, timeout=6):
+    """Return prefetched JSON, re-raise a prefetch error, or fetch `url` now."""
+    if prefetched is None:
+        return cached_get_json(url, ttl_seconds, timeout=timeout)
+    if isinstance(prefetched, Exception):
+        raise prefetched
+    return prefetched
 
 def hide_console():
     """Hide the console window on Windows"""
     if sys.platform == 'win32':
         try:
-            import ctypes
             kernel32 = ctypes.windll.kernel32
             user32 = ctypes.windll.user32
             
@@ -169,24 +468,23 @@ def hide_console():
 
 def kill_updater_processes():
     """Terminate any leftover updater.exe and aria2c.exe processes from previous runs."""
+    targets = ('updater.exe', 'aria2c.exe')
     try:
-        for proc in psutil.process_iter(['pid', 'name', 'exe']):
+        # Filter on the snapshot names first; only matches get a psutil.Process
+        # (exe() is far more expensive on Windows and, for these two binaries,
+        # the name already is the exe basename).
+        matches = [(pid, name) for pid, name in iter_process_names() if name in targets]
+        for pid, name in matches:
+            logger.info(f"Terminating leftover {name} PID={pid}")
             try:
-                name = (proc.info.get('name') or '').lower()
-                exe = proc.info.get('exe') or ''
-                # Kill both updater.exe and aria2c.exe
-                if name in ['updater.exe', 'aria2c.exe'] or (exe and os.path.basename(exe).lower() in ['updater.exe', 'aria2c.exe']):
-                    logger.info(f"Terminating leftover {name} PID={proc.pid}")
-                    try:
-                        proc.terminate()
-                        proc.wait(timeout=2)
-                    except Exception:
-                        try:
-                            proc.kill()
-                        except Exception:
-                            logger.debug(f"Failed to kill {name} PID={proc.pid}")
-            except Exception as e:
-                logger.debug(f"Error while checking process: {e}")
+                proc = psutil.Process(pid)
+                proc.terminate()
+                proc.wait(timeout=2)
+            except psutil.NoSuchProcess:
+                pass
+            except Exception:
+                if not terminate_pid(pid):
+                    logger.debug(f"Failed to kill {name} PID={pid}")
     except Exception as e:
         logger.debug(f"Failed to enumerate processes to kill updater.exe/aria2c.exe: {e}")
 
@@ -206,6 +504,21 @@ def _same_path(path_a, path_b):
     return os.path.normcase(os.path.normpath(str(path_a))) == os.path.normcase(os.path.normpath(str(path_b)))
 
 
+@lru_cache(maxsize=64)
+def _parse_version(version_str):
+    """'2.3.1.0' -> (2, 3, 1, 0); non-numeric components are ignored."""
+    return tuple(int(x) for x in version_str.split('.') if x.isdigit())
+
+
+def _file_sha256(path, chunk_size=1 << 20):
+    """Hex SHA-256 of the file at `path`, read in 1 MiB blocks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
 def _read_pending_update_path():
     """Read pending update executable path from marker file, with fallback to latest exe in update folder."""
     if not UPDATE_READY_FILE.exists():
@@ -315,9 +628,18 @@ def apply_downloaded_update_if_requested(argv):
     target_exe.parent.mkdir(parents=True, exist_ok=True)
     staged_target = target_exe.with_suffix('.new.exe')
 
+    # copy2 keeps the source mtime, so a target matching size and mtime is this
+    # same build applied by an earlier run (e.g. the relaunch failed): don't copy again
+    try:
+        src_st = os.stat(current_exe)
+        dst_st = os.stat(target_exe)
+        already_applied = (src_st.st_size, src_st.st_mtime_ns) == (dst_st.st_size, dst_st.st_mtime_ns)
+    except OSError:
+        already_applied = False
+
     start = time.time()
     last_error = None
-    while time.time() - start < 30:
+    while not already_applied and time.time() - start < 30:
         try:
             if staged_target.exists():
                 staged_target.unlink()
@@ -331,7 +653,9 @@ def apply_downloaded_update_if_requested(argv):
             logger.warning(f"Update apply retry after error: {e}")
             time.sleep(0.5)
 
-    if last_error is not None:
+    if already_applied:
+        logger.info(f"Update already applied: {target_exe} matches {current_exe}")
+    elif last_error is not None:
         logger.error(f"Unable to replace target executable after retries: {last_error}")
         return False
 
@@ -359,34 +683,65 @@ def apply_downloaded_update_if_requested(argv):
         logger.error(f"Failed to relaunch updated executable {target_exe}: {e}")
         return False
 
+_IS_ADMIN = None
+
 def is_admin():
-    """Check if the script is running with admin privileges"""
+    """Check if the script is running with admin privileges (cached: it cannot change while running)"""
+    global _IS_ADMIN
+    if _IS_ADMIN is not None:
+        return _IS_ADMIN
     try:
-        is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
-        logger.info(f"Admin check: {is_admin}")
-        return is_admin
+        _IS_ADMIN = ctypes.windll.shell32.IsUserAnAdmin() != 0
+        logger.debug(f"Admin check: {_IS_ADMIN}")
     except Exception as e:
         logger.error(f"Admin check failed: {e}")
-        return False
+        _IS_ADMIN = False
+    return _IS_ADMIN
+
+class SHELLEXECUTEINFOW(ctypes.Structure):
+    """ctypes layout of the Win32 SHELLEXECUTEINFOW structure used by ShellExecuteExW."""
+    _fields_ = [
+        ("cbSize", ctypes.wintypes.DWORD),
+        ("fMask", ctypes.wintypes.ULONG),
+        ("hwnd", ctypes.wintypes.HWND),
+        ("lpVerb", ctypes.wintypes.LPCWSTR),
+        ("lpFile", ctypes.wintypes.LPCWSTR),
+        ("lpParameters", ctypes.wintypes.LPCWSTR),
+        ("lpDirectory", ctypes.wintypes.LPCWSTR),
+        ("nShow", ctypes.c_int),
+        ("hInstApp", ctypes.wintypes.HINSTANCE),
+        ("lpIDList", ctypes.c_void_p),
+        ("lpClass", ctypes.wintypes.LPCWSTR),
+        ("hkeyClass", ctypes.wintypes.HKEY),
+        ("dwHotKey", ctypes.wintypes.DWORD),
+        ("hIconOrMonitor", ctypes.wintypes.HANDLE),
+        ("hProcess", ctypes.wintypes.HANDLE),
+    ]
+
+SEE_MASK_NOASYNC = 0x00000100
 
 def run_as_admin():
-    """Relaunch the script with admin privileges"""
+    """Relaunch the script with admin privileges; returns False if elevation was refused"""
     try:
         if sys.platform == 'win32':
-            # Get the path to the Python executable and the script
-            script = os.path.abspath(sys.argv[0])
-            params = ' '.join([script] + sys.argv[1:])
+            # Frozen: the exe is sys.executable itself, so only forward the arguments.
+            # Script: python.exe needs the script path first. list2cmdline quotes args with spaces.
+            if getattr(sys, 'frozen', False):
+                params = subprocess.list2cmdline(sys.argv[1:])
+            else:
+                params = subprocess.list2cmdline([os.path.abspath(sys.argv[0])] + sys.argv[1:])
             
             logger.info("Requesting admin elevation...")
-            # Use ShellExecuteW to run as admin
-            ctypes.windll.shell32.ShellExecuteW(
-                None, 
-                "runas", 
-                sys.executable, 
-                params, 
-                None, 
-                1  # SW_SHOWNORMAL
-            )
+            sei = SHELLEXECUTEINFOW()
+            sei.cbSize = ctypes.sizeof(sei)
+            sei.fMask = SEE_MASK_NOASYNC  # Complete the launch before this process exits
+            sei.lpVerb = "runas"
+            sei.lpFile = sys.executable
+            sei.lpParameters = params
+            sei.nShow = 1  # SW_SHOWNORMAL
+            if not ctypes.windll.shell32.ShellExecuteExW(ctypes.byref(sei)):
+                logger.warning(f"Admin elevation not granted (error {ctypes.GetLastError()})")
+                return False
             return True
     except Exception as e:
         logger.error(f"Failed to elevate privileges: {e}")
@@ -398,7 +753,7 @@ def load_qss():
     qss_path = BASE / "style.qss"
     try:
         if qss_path.exists():
-            return qss_path.read_text()
+            return qss_path.read_text(encoding='utf-8')
         else:
             logger.warning(f"QSS file not found at: {qss_path}")
     except Exception as e:
@@ -406,6 +761,9 @@ def load_qss():
     return ""
 
 class SidebarButton(QtWidgets.QPushButton):
+    # Rendered icons keyed by icon path: each SVG is rendered and tinted once per process
+    _icon_cache = {}
+
     def __init__(self, text, icon_path=None, parent=None):
         super().__init__(text, parent)
         self.setCheckable(True)
@@ -415,54 +773,53 @@ class SidebarButton(QtWidgets.QPushButton):
         if icon_path and icon_path.exists():
             # Define icon size
             icon_size = QtCore.QSize(48, 48)
-            
-            # Render SVG at target size for crisp display
-            try:
-                from PySide6.QtSvg import QSvgRenderer #type:ignore
-                
-                # Render original (colored) SVG
-                renderer = QSvgRenderer(str(icon_path))
-                orig_pix = QtGui.QPixmap(icon_size)
-                orig_pix.fill(QtCore.Qt.transparent)
-                painter = QtGui.QPainter(orig_pix)
-                painter.setRenderHint(QtGui.QPainter.Antialiasing)
-                painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
-                renderer.render(painter)
-                painter.end()
-                
-                # Create white-tinted version for unchecked state
-                white_pix = QtGui.QPixmap(orig_pix.size())
-                white_pix.fill(QtCore.Qt.transparent)
-                p = QtGui.QPainter(white_pix)
-                p.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
-                p.drawPixmap(0, 0, orig_pix)
-                p.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
-                p.fillRect(white_pix.rect(), QtGui.QColor('white'))
-                p.end()
-                
-            except Exception:
-                # Fallback: load as regular pixmap and scale
-                orig_pix = QtGui.QPixmap(str(icon_path))
-                orig_pix = orig_pix.scaled(icon_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                
-                white_pix = QtGui.QPixmap(orig_pix.size())
-                white_pix.fill(QtCore.Qt.transparent)
-                p = QtGui.QPainter(white_pix)
-                p.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
-                p.drawPixmap(0, 0, orig_pix)
-                p.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
-                p.fillRect(white_pix.rect(), QtGui.QColor('white'))
-                p.end()
-
-            icon = QtGui.QIcon()
-            # Off = not checked -> white icon
-            icon.addPixmap(white_pix, QtGui.QIcon.Normal, QtGui.QIcon.Off)
-            # On = checked -> original (colored) icon
-            icon.addPixmap(orig_pix, QtGui.QIcon.Normal, QtGui.QIcon.On)
+            key = str(icon_path)
+            icon = SidebarButton._icon_cache.get(key)
+            if icon is None:
+                icon = SidebarButton._icon_cache[key] = self._build_icon(icon_path, icon_size)
             self.setIcon(icon)
             self.setIconSize(icon_size)
         # Center the icon by removing text and ensuring proper alignment
         self.setText("")
+
+    @staticmethod
+    def _build_icon(icon_path, icon_size):
+        """Return a QIcon showing a white icon when unchecked and the original colors when checked."""
+        # Render SVG at target size for crisp display
+        try:
+            from PySide6.QtSvg import QSvgRenderer #type:ignore
+            
+            # Render original (colored) SVG
+            renderer = QSvgRenderer(str(icon_path))
+            orig_pix = QtGui.QPixmap(icon_size)
+            orig_pix.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(orig_pix)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+            renderer.render(painter)
+            painter.end()
+        except Exception:
+            # Fallback: load as regular pixmap and scale
+            orig_pix = QtGui.QPixmap(str(icon_path))
+            orig_pix = orig_pix.scaled(icon_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+
+        # Create white-tinted version for unchecked state
+        white_pix = QtGui.QPixmap(orig_pix.size())
+        white_pix.fill(QtCore.Qt.transparent)
+        p = QtGui.QPainter(white_pix)
+        p.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
+        p.drawPixmap(0, 0, orig_pix)
+        p.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
+        p.fillRect(white_pix.rect(), QtGui.QColor('white'))
+        p.end()
+
+        icon = QtGui.QIcon()
+        # Off = not checked -> white icon
+        icon.addPixmap(white_pix, QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        # On = checked -> original (colored) icon
+        icon.addPixmap(orig_pix, QtGui.QIcon.Normal, QtGui.QIcon.On)
+        return icon
+
 class SplashScreen(QtWidgets.QWidget):
     """Modern stylized loading splash screen with animation"""
     def __init__(self, parent=None):
@@ -584,6 +941,15 @@ class SplashScreen(QtWidgets.QWidget):
 
 import os
 
+# Translation keys for HTTP statuses with a dedicated download error message
+DOWNLOAD_HTTP_ERROR_KEYS = {
+    403: 'messages.download.error_403',
+    404: 'messages.download.error_404',
+    500: 'messages.download.error_500',
+    502: 'messages.download.error_502',
+    503: 'messages.download.error_503',
+}
+
 class DownloadThread(QtCore.QThread):
     progress = QtCore.Signal(int, float, str)  # value, speed_mbs, eta_str
     finished = QtCore.Signal(bool, str)
@@ -620,16 +986,9 @@ class DownloadThread(QtCore.QThread):
                 logger.error(f"Download failed with HTTP {status_code}")
                 
                 # Generate user-friendly error message based on status code
-                if status_code == 404:
-                    error_msg = translator.t('messages.download.error_404')
-                elif status_code == 502:
-                    error_msg = translator.t('messages.download.error_502')
-                elif status_code == 503:
-                    error_msg = translator.t('messages.download.error_503')
-                elif status_code == 403:
-                    error_msg = translator.t('messages.download.error_403')
-                elif status_code == 500:
-                    error_msg = translator.t('messages.download.error_500')
+                error_key = DOWNLOAD_HTTP_ERROR_KEYS.get(status_code)
+                if error_key:
+                    error_msg = translator.t(error_key)
                 elif 400 <= status_code < 500:
                     error_msg = translator.t('messages.download.error_4xx', code=status_code)
                 elif 500 <= status_code < 600:
@@ -650,15 +1009,23 @@ class DownloadThread(QtCore.QThread):
                     logger.info(f"File size from GET response: {self.total_size / (1024*1024):.2f} MB")
             
             downloaded = 0
-            chunk_count = 0
-            start_time = time.time()
+            start_time = time.monotonic()
+            last_emit = 0.0
+            inv_mb = 1.0 / (1024 * 1024)
+            inv_total = 1000.0 / self.total_size if self.total_size > 0 else 0.0
             
             if self.total_size > 0:
                 logger.info(f"Download initiated, total size: {self.total_size / (1024*1024):.2f} MB")
             else:
                 logger.info(f"Download initiated, size unknown")
-            with open(self.path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            # Read large blocks straight from the raw stream (content-encoding still decoded):
+            # far fewer Python-level iterations than iter_content's 8 KB chunks.
+            response.raw.decode_content = True
+            with open(self.path, 'wb', buffering=1 << 20) as f:
+                while True:
+                    chunk = response.raw.read(256 * 1024)
+                    if not chunk:
+                        break
                     # Check if paused
                     while self._is_paused and not self._is_cancelled:
                         time.sleep(0.1)
@@ -674,20 +1041,21 @@ class DownloadThread(QtCore.QThread):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
-                        chunk_count += 1
-                        if chunk_count % 100 == 0:  # Flush every 100 chunks (~800KB)
-                            f.flush()
-                            elapsed = time.time() - start_time
-                            speed = downloaded / elapsed / (1024 * 1024) if elapsed > 0 else 0  # MB/s
+                        now = time.monotonic()
+                        if now - last_emit >= 0.1:  # At most 10 progress updates per second
+                            last_emit = now
+                            elapsed = now - start_time
+                            speed = downloaded * inv_mb / elapsed if elapsed > 0 else 0  # MB/s
                             if self.total_size > 0:
-                                progress = int((downloaded / self.total_size) * 1000)
+                                progress = int(downloaded * inv_total)
                                 remaining = self.total_size - downloaded
-                                eta_seconds = remaining / (speed * 1024 * 1024) if speed > 0 else 0
-                                eta_str = f"{int(eta_seconds // 60):02d}:{int(eta_seconds % 60):02d}"
+                                eta_seconds = int(remaining * inv_mb / speed) if speed > 0 else 0
+                                minutes, seconds = divmod(eta_seconds, 60)
+                                eta_str = f"{minutes:02d}:{seconds:02d}"
                             else:
                                 # Show downloaded MB when total size is unknown
                                 progress = 0
-                                eta_str = f"{downloaded / (1024 * 1024):.1f} MB"
+                                eta_str = f"{downloaded * inv_mb:.1f} MB"
                             self.progress.emit(progress, speed, eta_str)
             if self.total_size == 0 or downloaded >= self.total_size:
                 self.progress.emit(1000, 0, "00:00")
@@ -1820,6 +2188,122 @@ catch {
             self.finished.emit(False, error_msg)
 
 
+# Windows Defender exclusions needed by the Diagbox install, and the PowerShell
+# command adding any that are missing (prints {"added": [...], "failed": [...]}).
+# Built once and shared by the install thread and the manual Defender action.
+DEFENDER_EXCLUSION_PATHS = (
+    r"C:\AWRoot",
+    r"C:\INSTALL",
+    r"C:\Program Files (x86)\PSA VCI",
+    r"C:\Program Files\PSA VCI",
+    r"C:\Windows\VCX.dll",
+)
+_PS_DEFENDER_SCRIPT = (
+    "try { $existing=(Get-MpPreference).ExclusionPath; $added=@(); $failed=@();"
+    + "foreach($p in @(" + ",".join("'{}'".format(p) for p in DEFENDER_EXCLUSION_PATHS) + ")) { if($existing -notcontains $p) { try { Add-MpPreference -ExclusionPath $p; $added += $p } catch { $failed += $p } } }"
+    + "$res = @{added=$added; failed=$failed}; $res | ConvertTo-Json -Compress } catch { Write-Error $_; exit 1 }"
+)
+DEFENDER_EXCLUSION_COMMAND = ("powershell.exe", "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", _PS_DEFENDER_SCRIPT)
+
+# Exclusions confirmed by a successful run are remembered here so repeat installs
+# skip the PowerShell launch; pass --force-defender to always re-check.
+DEFENDER_CACHE_FILE = CONFIG_DIR / "defender_exclusions.json"
+DEFENDER_CACHE_MAX_AGE = 30 * 24 * 3600
+
+def defender_exclusions_cached():
+    """Return True if every DEFENDER_EXCLUSION_PATHS entry was confirmed within DEFENDER_CACHE_MAX_AGE."""
+    try:
+        if time.time() - DEFENDER_CACHE_FILE.stat().st_mtime >= DEFENDER_CACHE_MAX_AGE:
+            return False
+        with open(DEFENDER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        return set(DEFENDER_EXCLUSION_PATHS) <= set(cached.get('paths') or [])
+    except (OSError, ValueError, AttributeError, TypeError):
+        return False
+
+def remember_defender_exclusions():
+    """Record that all DEFENDER_EXCLUSION_PATHS are now present."""
+    try:
+        DEFENDER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(DEFENDER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'paths': list(DEFENDER_EXCLUSION_PATHS), 'added_at': time.time()}, f)
+    except OSError as e:
+        logger.debug(f"Failed to write Defender exclusion cache: {e}")
+
+def wait_for_any_path(paths, timeout=3.0):
+    """Return True as soon as one of `paths` exists, polling with exponential backoff up to `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        if any(os.path.exists(p) for p in paths):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay *= 4
+
+# path -> (monotonic expiry, exists); short-lived so back-to-back driver flows share one stat
+_exists_cache = {}
+
+def _cached_exists(path, ttl=2.0):
+    """os.path.exists(path), memoized for `ttl` seconds."""
+    now = time.monotonic()
+    hit = _exists_cache.get(path)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    exists = os.path.exists(path)
+    _exists_cache[path] = (now + ttl, exists)
+    return exists
+
+def _forget_exists(path):
+    """Drop the memoized result for `path` so the next check re-stats it."""
+    _exists_cache.pop(path, None)
+
+_7za_candidates = None
+
+def get_7za_candidates():
+    """Return the 7za executables to try, bundled first then PATH (resolved once per process)."""
+    global _7za_candidates
+    if _7za_candidates:
+        return _7za_candidates
+    # Prefer bundled 7za, then fallback to system-installed 7za
+    candidates = []
+    bundled_7za = BASE / "tools" / "7za.exe"
+    if bundled_7za.exists():
+        candidates.append(str(bundled_7za))
+
+    # Add system command '7za' as fallback
+    try:
+        if shutil.which("7za"):
+            candidates.append("7za")
+    except Exception:
+        pass
+    # An empty result is not kept, so a 7za installed later is still picked up
+    _7za_candidates = tuple(candidates)
+    return _7za_candidates
+
+# 7za -bsp1 progress lines ("45% 123 - path\file"), separated by CR/LF or backspaces
+_7Z_PROGRESS_RE = re.compile(rb'\s*(\d+)%.*? - (.+)')
+_7Z_LINE_SPLIT_RE = re.compile(rb'[\r\n\x08]+')
+# Encoding used by text-mode subprocess pipes, for decoding raw console output the same way
+SUBPROCESS_ENCODING = locale.getpreferredencoding(False)
+
+# Output kept from the runtimes installer: the last 256 blocks (~2 MB) are plenty for diagnostics
+RUNTIMES_OUTPUT_CHUNKS = 256
+
+
+def drain_pipe(pipe, chunks):
+    """Read binary `pipe` until EOF, appending each block to `chunks`."""
+    try:
+        while True:
+            data = pipe.read(8192)
+            if not data:
+                break
+            chunks.append(data)
+    except (OSError, ValueError):
+        pass
+
 class InstallThread(QtCore.QThread):
     finished = QtCore.Signal(bool, str)
     progress = QtCore.Signal(int)  # progress percentage
@@ -1855,78 +2339,58 @@ class InstallThread(QtCore.QThread):
             extraction_errors = []
             
             # FIRST: Create Windows Defender exclusions BEFORE extraction (may require admin)
-            try:
-                defender_paths = [
-                    r"C:\AWRoot",
-                    r"C:\INSTALL",
-                    r"C:\Program Files (x86)\PSA VCI",
-                    r"C:\Program Files\PSA VCI",
-                    r"C:\Windows\VCX.dll",
-                ]
-                # Build PowerShell script to add any missing exclusions and return JSON
-                ps_paths = ",".join(["'{}'".format(p) for p in defender_paths])
-                ps_script = (
-                    "try { $existing=(Get-MpPreference).ExclusionPath; $added=@(); $failed=@();"
-                    + "foreach($p in @(" + ps_paths + ")) { if($existing -notcontains $p) { try { Add-MpPreference -ExclusionPath $p; $added += $p } catch { $failed += $p } } }"
-                    + "$res = @{added=$added; failed=$failed}; $res | ConvertTo-Json -Compress } catch { Write-Error $_; exit 1 }"
-                )
-                cmd = ["powershell.exe", "-NoProfile", "-NonInteractive", "-Command", ps_script]
-                logger.info("Attempting to create Defender exclusions via PowerShell (before extraction)")
-                proc = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
-                if proc.returncode == 0:
-                    out = (proc.stdout or '').strip()
-                    try:
-                        import json
-                        j = json.loads(out) if out else {"added":[], "failed":[]}
-                        added = j.get('added') or []
-                        failed = j.get('failed') or []
-                        if failed:
-                            msg = f"Failed to add exclusions: {', '.join(failed)}"
-                            logger.warning(msg)
-                            try:
-                                self.defender_finished.emit(False, msg)
-                            except Exception:
-                                pass
-                        else:
-                            msg = f"Added exclusions: {', '.join(added)}" if added else "No changes needed"
-                            logger.info(msg)
+            if '--force-defender' not in sys.argv and defender_exclusions_cached():
+                logger.info("Defender exclusions already confirmed recently, skipping PowerShell")
+                try:
+                    self.defender_finished.emit(True, "Exclusions already present (cached)")
+                except Exception:
+                    pass
+            else:
+                try:
+                    logger.info("Attempting to create Defender exclusions via PowerShell (before extraction)")
+                    proc = subprocess.run(DEFENDER_EXCLUSION_COMMAND, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
+                    if proc.returncode == 0:
+                        out = (proc.stdout or '').strip()
+                        try:
+                            j = json.loads(out) if out else {"added":[], "failed":[]}
+                            added = j.get('added') or []
+                            failed = j.get('failed') or []
+                            if failed:
+                                msg = f"Failed to add exclusions: {', '.join(failed)}"
+                                logger.warning(msg)
+                                try:
+                                    self.defender_finished.emit(False, msg)
+                                except Exception:
+                                    pass
+                            else:
+                                msg = f"Added exclusions: {', '.join(added)}" if added else "No changes needed"
+                                logger.info(msg)
+                                remember_defender_exclusions()
+                                try:
+                                    self.defender_finished.emit(True, msg)
+                                except Exception:
+                                    pass
+                        except Exception as e:
+                            logger.error(f"Failed to parse Defender PowerShell output: {e}")
                             try:
-                                self.defender_finished.emit(True, msg)
+                                self.defender_finished.emit(False, f"Parse error: {e}")
                             except Exception:
                                 pass
-                    except Exception as e:
-                        logger.error(f"Failed to parse Defender PowerShell output: {e}")
+                    else:
+                        err = (proc.stderr or '').strip()
+                        logger.error(f"PowerShell exited with code {proc.returncode}: {err}")
                         try:
-                            self.defender_finished.emit(False, f"Parse error: {e}")
+                            self.defender_finished.emit(False, f"PowerShell error: {err}")
                         except Exception:
                             pass
-                else:
-                    err = (proc.stderr or '').strip()
-                    logger.error(f"PowerShell exited with code {proc.returncode}: {err}")
+                except Exception as e:
+                    logger.error(f"Failed to create Defender exclusions: {e}", exc_info=True)
                     try:
-                        self.defender_finished.emit(False, f"PowerShell error: {err}")
+                        self.defender_finished.emit(False, str(e))
                     except Exception:
                         pass
-            except Exception as e:
-                logger.error(f"Failed to create Defender exclusions: {e}", exc_info=True)
-                try:
-                    self.defender_finished.emit(False, str(e))
-                except Exception:
-                    pass
             
-            # Prefer bundled 7za, then fallback to system-installed 7za
-            candidates = []
-            bundled_7za = BASE / "tools" / "7za.exe"
-            if bundled_7za.exists():
-                candidates.append(str(bundled_7za))
-
-            # Add system command '7za' as fallback
-            try:
-                if shutil.which("7za"):
-                    candidates.append("7za")
-            except Exception:
-                pass
-
+            candidates = get_7za_candidates()
             if not candidates:
                 logger.error("No 7za executable found (checked bundled tools and PATH)")
                 self.finished.emit(False, "7za executable not found")
@@ -1942,7 +2406,7 @@ class InstallThread(QtCore.QThread):
             # Try each candidate until one succeeds
             for exe in candidates:
                 tried.append(exe)
-                logger.info(f"Attempting extraction with: {exe}")
+                logger.info("Attempting extraction with: %s", exe)
                 try:
                     # Build command with optional password
                     cmd = [exe, "x", self.path, "-oC:\\", "-y", "-bsp1"]
@@ -1953,57 +2417,61 @@ class InstallThread(QtCore.QThread):
                         cmd,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True,
+                        bufsize=0,
                         creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
                     )
 
-                    stdout_lines = []
-                    # Read output in real-time to get progress
+                    # Read raw stdout chunks and parse progress on bytes; only the
+                    # file name is decoded, and signals fire only when values change.
+                    stdout_fd = self.process.stdout.fileno()
+                    stdout_chunks = []
+                    # stderr is drained concurrently so a chatty 7za cannot block on a full pipe
+                    stderr_chunks = []
+                    stderr_reader = threading.Thread(target=drain_pipe, args=(self.process.stderr, stderr_chunks), daemon=True)
+                    stderr_reader.start()
+                    pending = b''
+                    last_percent = -1
+                    last_filename = b''
                     while True:
-                        output = self.process.stdout.readline()
-                        if output == '' and self.process.poll() is not None:
+                        data = os.read(stdout_fd, 8192)
+                        if not data:
                             break
-                        if output:
-                            stdout_lines.append(output)
-                            # Log the output for debugging
-                            #logger.debug(f"7z output ({exe}): {output.strip()}")
-
+                        stdout_chunks.append(data)
+                        lines = _7Z_LINE_SPLIT_RE.split(pending + data)
+                        pending = lines.pop()
+                        for line in lines:
                             # 7z outputs progress like "1% 2909 - filename"
-                            line = output.strip()
-                            if '%' in line and ' - ' in line:
-                                try:
-                                    percent_str = line.split('%')[0].strip()
-                                    if percent_str.isdigit():
-                                        percent = int(percent_str)
-                                        logger.debug(f"Progress extracted: {percent}%")
-                                        self.progress.emit(percent)
-
-                                    filename = line.split(' - ', 1)[1] if ' - ' in line else ''
-                                    if filename:
-                                        self.file_progress.emit(filename)
-                                except Exception as e:
-                                    logger.warning(f"Error parsing progress: {e}")
-                                    pass
+                            match = _7Z_PROGRESS_RE.match(line)
+                            if not match:
+                                continue
+                            percent = int(match.group(1))
+                            if percent != last_percent:
+                                last_percent = percent
+                                logger.debug("Progress extracted: %s%%", percent)
+                                self.progress.emit(percent)
+                            filename = match.group(2).strip()
+                            if filename and filename != last_filename:
+                                last_filename = filename
+                                self.file_progress.emit(filename.decode(SUBPROCESS_ENCODING, 'replace'))
 
                     # After process ends, collect stderr and decide
-                    return_code = self.process.poll()
-                    stderr = self.process.stderr.read() if self.process.stderr is not None else ''
-                    combined_output = '\n'.join(stdout_lines) + '\n' + (stderr or '')
+                    return_code = self.process.wait()
+                    stderr_reader.join(timeout=5)
+                    stderr = b''.join(stderr_chunks).decode(SUBPROCESS_ENCODING, 'replace')
+                    combined_output = b''.join(stdout_chunks).decode(SUBPROCESS_ENCODING, 'replace') + '\n' + (stderr or '')
 
                     if return_code == 0 and "Can't open as archive" not in combined_output:
-                        logger.info(f"Extraction succeeded with: {exe}")
+                        logger.info("Extraction succeeded with: %s", exe)
                         extraction_succeeded = True
                         break
                     else:
-                        logger.warning(f"Extraction failed with {exe}: return_code={return_code}, stderr={stderr[:200]}")
+                        logger.warning("Extraction failed with %s: return_code=%s, stderr=%s", exe, return_code, stderr[:200])
                         last_errors.append(f"{exe}: {stderr[:400]}")
                         # try next candidate
                         continue
 
                 except Exception as e:
-                    logger.error(f"Extraction attempt with {exe} raised exception: {e}")
+                    logger.error("Extraction attempt with %s raised exception: %s", exe, e)
                     last_errors.append(f"{exe}: {str(e)}")
                     continue
 
@@ -2023,22 +2491,9 @@ class InstallThread(QtCore.QThread):
                 r"C:\AWRoot\bin\launcher\Diagbox.exe",
                 r"C:\AWRoot\bin\fi\Version.ini",
             ]
-            verification_ok = False
             if extraction_succeeded:
-                # Give the extraction a moment to flush files (short poll)
-                for _ in range(6):  # up to ~3 seconds
-                    for p in verification_paths:
-                        try:
-                            if os.path.exists(p):
-                                verification_ok = True
-                                break
-                        except Exception:
-                            continue
-                    if verification_ok:
-                        break
-                    time.sleep(0.5)
-
-                if not verification_ok:
+                # Give the extraction a moment to flush files (short poll, up to ~3 seconds)
+                if not wait_for_any_path(verification_paths, timeout=3.0):
                     logger.warning("Post-extraction verification failed: expected files not found")
                     extraction_succeeded = False
                     extraction_errors.append("Extraction incomplete or interrupted: expected files missing")
@@ -2049,34 +2504,45 @@ class InstallThread(QtCore.QThread):
                 dpinst_path = r"C:\AWRoot\extra\drivers\xsevo\amd64\DPInst.exe"
                 dp_path_arg = r"C:\AWRoot\extra\drivers\xsevo\dp"
                 ini_check = r"C:\Windows\System32\DriverStore\FileRepository\vcommusb.inf_amd64_0cb1ee01f7e64ab9.ini"
-                if os.path.exists(dpinst_path):
-                    logger.info(f"Found DPInst at: {dpinst_path}")
-                    # If .ini already exists, consider driver already installed
-                    if os.path.exists(ini_check):
-                        msg = translator.t('messages.vci_driver.already_present')
-                        logger.info("VCI .ini present before installation - already installed")
-                        self.driver_finished.emit(True, msg)
-                    else:
-                        logger.info(f"Launching DPInst with /PATH {dp_path_arg} (interactive mode)")
+                # If .ini already exists, consider driver already installed
+                if _cached_exists(ini_check):
+                    msg = translator.t('messages.vci_driver.already_present')
+                    logger.info("VCI .ini present before installation - already installed")
+                    self.driver_finished.emit(True, msg)
+                else:
+                    logger.info(f"Launching DPInst with /PATH {dp_path_arg} (interactive mode)")
+                    # A missing DPInst surfaces as FileNotFoundError, no separate exists() probe
+                    try:
+                        dp_cwd = os.path.dirname(dpinst_path)
                         try:
-                            dp_cwd = os.path.dirname(dpinst_path)
                             drv_proc = subprocess.run(
                                 [dpinst_path, '/PATH', dp_path_arg],
                                 capture_output=True,
-                                text=True,
-                                cwd=dp_cwd
+                                encoding=SUBPROCESS_ENCODING,
+                                errors='replace',
+                                cwd=dp_cwd,
+                                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
                             )
+                        except (FileNotFoundError, NotADirectoryError):
+                            drv_proc = None
+                        if drv_proc is None:
+                            # DPInst not found - emit not found message
+                            msg = translator.t('messages.vci_driver.not_found', path=dpinst_path)
+                            self.driver_finished.emit(False, msg)
+                        else:
                             out = (drv_proc.stdout or '').strip()
                             err = (drv_proc.stderr or '').strip()
                             rc = drv_proc.returncode
-                            logger.debug(f"DPInst returned code={rc}")
-                            if out:
-                                logger.debug(f"DPInst stdout: {out[:2000]}")
+                            logger.debug("DPInst returned code=%s", rc)
+                            if out and logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("DPInst stdout: %s", out[-2000:])
                             if err:
-                                logger.warning(f"DPInst stderr: {err[:2000]}")
+                                logger.warning("DPInst stderr: %s", err[-2000:])
                             # If DPInst indicates success but requires reboot (e.g., return code 256), treat as success-with-reboot
+                            # DPInst may have just created the .ini: verify with a fresh stat
+                            _forget_exists(ini_check)
                             if rc == 0:
-                                if os.path.exists(ini_check):
+                                if _cached_exists(ini_check):
                                     msg = translator.t('messages.vci_driver.success')
                                     self.driver_finished.emit(True, msg)
                                 else:
@@ -2089,13 +2555,9 @@ class InstallThread(QtCore.QThread):
                             else:
                                 msg = translator.t('messages.vci_driver.warning', code=rc)
                                 self.driver_finished.emit(False, msg + "\n" + (err or ''))
-                        except Exception as e:
-                            logger.error(f"DPInst exception inside InstallThread: {e}", exc_info=True)
-                            self.driver_finished.emit(False, translator.t('messages.vci_driver.error', error=str(e)))
-                else:
-                    # DPInst not found - emit not found message
-                    msg = translator.t('messages.vci_driver.not_found', path=dpinst_path)
-                    self.driver_finished.emit(False, msg)
+                    except Exception as e:
+                        logger.error(f"DPInst exception inside InstallThread: {e}", exc_info=True)
+                        self.driver_finished.emit(False, translator.t('messages.vci_driver.error', error=str(e)))
             except Exception as e:
                 logger.debug(f"Driver install pre-runtimes check failed: {e}")
 
@@ -2103,34 +2565,48 @@ class InstallThread(QtCore.QThread):
             runtimes_path = Path(r"C:\AWRoot\Extra\runtimes\runtimes.exe")
             runtimes_warnings = []
             try:
-                if runtimes_path.exists():
-                    logger.info(f"Found runtimes installer at: {runtimes_path}, launching with /ai /gm2")
+                # Run silently and wait for completion; creationflags hides window on Windows.
+                # A missing installer surfaces as FileNotFoundError, no separate exists() probe.
+                logger.info("[RUNTIMES] About to launch runtimes installer...")
+                try:
+                    proc = subprocess.Popen(
+                        [str(runtimes_path), '/ai', '/gm2'],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        bufsize=65536,
+                        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+                    )
+                except FileNotFoundError:
+                    proc = None
+                if proc is not None:
+                    logger.info(f"Found runtimes installer at: {runtimes_path}, launched with /ai /gm2")
                     # Notify UI that runtimes installation is starting
                     try:
                         logger.info("[RUNTIMES] Emitting runtimes_started signal")
                         self.runtimes_started.emit()
                     except Exception as e:
                         logger.error(f"[RUNTIMES] Failed to emit runtimes_started: {e}")
-                    # Run silently and wait for completion; creationflags hides window on Windows
-                    logger.info("[RUNTIMES] About to execute subprocess.run...")
-                    proc = subprocess.run(
-                        [str(runtimes_path), '/ai', '/gm2'],
-                        capture_output=True,
-                        text=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-                    )
-                    logger.info(f"[RUNTIMES] subprocess.run completed with returncode={proc.returncode}")
-                    # Log stdout/stderr for diagnostics (truncated)
-                    try:
-                        out = (proc.stdout or '').strip()
-                        err = (proc.stderr or '').strip()
-                        if out:
-                            logger.info(f"Runtimes stdout: {out[:2000]}")
-                        if err:
-                            logger.warning(f"Runtimes stderr: {err[:2000]}")
-                    except Exception as log_ex:
-                        logger.warning(f"[RUNTIMES] Failed to log stdout/stderr: {log_ex}")
-                    if proc.returncode == 0:
+                    # Both pipes are drained as the installer writes, keeping only the tail.
+                    out_chunks = collections.deque(maxlen=RUNTIMES_OUTPUT_CHUNKS)
+                    err_chunks = collections.deque(maxlen=RUNTIMES_OUTPUT_CHUNKS)
+                    readers = [
+                        threading.Thread(target=drain_pipe, args=(proc.stdout, out_chunks), daemon=True),
+                        threading.Thread(target=drain_pipe, args=(proc.stderr, err_chunks), daemon=True),
+                    ]
+                    for reader in readers:
+                        reader.start()
+                    returncode = proc.wait()
+                    for reader in readers:
+                        reader.join(timeout=5)
+                    logger.info("[RUNTIMES] runtimes installer completed with returncode=%s", returncode)
+                    out = b''.join(out_chunks).decode(SUBPROCESS_ENCODING, 'replace').strip()
+                    err = b''.join(err_chunks).decode(SUBPROCESS_ENCODING, 'replace').strip()
+                    # Log stdout/stderr for diagnostics (tail only)
+                    if out:
+                        logger.info(f"Runtimes stdout: {out[-2000:]}")
+                    if err:
+                        logger.warning(f"Runtimes stderr: {err[-2000:]}")
+                    if returncode == 0:
                         msg = translator.t('messages.install.runtimes.success')
                         logger.info(msg)
                         try:
@@ -2139,13 +2615,13 @@ class InstallThread(QtCore.QThread):
                         except Exception as e:
                             logger.error(f"[RUNTIMES] Failed to emit runtimes_finished: {e}")
                     else:
-                        msg = translator.t('messages.install.runtimes.failed', code=proc.returncode)
-                        logger.warning(f"{msg}: {proc.stderr[:400]}")
+                        msg = translator.t('messages.install.runtimes.failed', code=returncode)
+                        logger.warning(f"{msg}: {err[-400:]}")
                         runtimes_warnings.append(msg)
                         try:
                             # include stderr in the emitted message for UI/logging
                             logger.info(f"[RUNTIMES] Emitting runtimes_finished signal: success=False")
-                            self.runtimes_finished.emit(False, msg + "\n" + (proc.stderr or ""))
+                            self.runtimes_finished.emit(False, msg + "\n" + err[-2000:])
                         except Exception as e:
                             logger.error(f"[RUNTIMES] Failed to emit runtimes_finished: {e}")
                 else:
@@ -2190,6 +2666,92 @@ class InstallThread(QtCore.QThread):
             self.finished.emit(False, f"Installation failed: {e}")
 
 
+class SHFILEOPSTRUCTW(ctypes.Structure):
+    """ctypes layout of the Win32 SHFILEOPSTRUCTW structure used by SHFileOperationW."""
+    _fields_ = [
+        ("hwnd", ctypes.wintypes.HWND),
+        ("wFunc", ctypes.wintypes.UINT),
+        ("pFrom", ctypes.c_void_p),
+        ("pTo", ctypes.c_void_p),
+        ("fFlags", ctypes.wintypes.WORD),
+        ("fAnyOperationsAborted", ctypes.wintypes.BOOL),
+        ("hNameMappings", ctypes.c_void_p),
+        ("lpszProgressTitle", ctypes.wintypes.LPCWSTR),
+    ]
+
+FO_DELETE = 0x0003
+FOF_NO_UI = 0x0614  # FOF_SILENT | FOF_NOCONFIRMATION | FOF_NOERRORUI | FOF_NOCONFIRMMKDIR
+
+def batch_delete_files(paths):
+    """Permanently delete `paths` with a single SHFileOperationW call (Windows only).
+
+    Returns True when the shell reports success; callers should still check
+    which paths are gone, as the shell may skip some entries.
+    """
+    try:
+        # pFrom is a list of NUL-separated paths terminated by a double NUL
+        buffer = ctypes.create_unicode_buffer('\0'.join(paths) + '\0\0')
+        op = SHFILEOPSTRUCTW()
+        op.wFunc = FO_DELETE
+        op.pFrom = ctypes.cast(buffer, ctypes.c_void_p)
+        op.fFlags = FOF_NO_UI
+        result = ctypes.windll.shell32.SHFileOperationW(ctypes.byref(op))
+        if result != 0:
+            logger.debug(f"SHFileOperationW returned 0x{result:x}")
+        return result == 0
+    except Exception as e:
+        logger.debug(f"Batch shell delete failed: {e}")
+        return False
+
+def fast_rmtree(path):
+    """Delete the tree at `path` like shutil.rmtree, unlinking files on a thread pool.
+
+    The tree is walked with os.scandir, files (and symlinks/junctions, which are
+    never followed) are unlinked in parallel, then directories are removed
+    deepest first. The first error is raised, as with shutil.rmtree.
+    """
+    if os.path.islink(path):
+        raise OSError(f"Cannot call rmtree on a symbolic link: {path}")
+    dirs = []
+    files = []
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as it:
+            for entry in it:
+                attrs = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+                if (entry.is_dir(follow_symlinks=False) and not entry.is_symlink()
+                        and not attrs & stat.FILE_ATTRIBUTE_REPARSE_POINT):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+    if files:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            for _ in executor.map(os.unlink, files):
+                pass
+    # Parents are always listed before their children, so reverse order is deepest first
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+def remove_folders_native(folders):
+    """Delete `folders` with a single native command (rd /s /q on Windows, rm -rf elsewhere)."""
+    if sys.platform == 'win32':
+        cmd = ["cmd", "/c", "rd", "/s", "/q", *folders]
+    else:
+        cmd = ["rm", "-rf", "--", *folders]
+    try:
+        proc = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        )
+        if proc.returncode != 0:
+            logger.debug(f"Native folder removal returned {proc.returncode}: {(proc.stderr or '').strip()[:500]}")
+    except Exception as e:
+        logger.debug(f"Native folder removal failed, falling back to shutil.rmtree: {e}")
+
 class CleanThread(QtCore.QThread):
     """Thread for cleaning Diagbox folders, shortcuts and driver items
 
@@ -2200,6 +2762,15 @@ class CleanThread(QtCore.QThread):
     finished = QtCore.Signal(bool, str, int)  # success, message, success_count
     progress = QtCore.Signal(int, int)  # current, total
     item_progress = QtCore.Signal(str)  # current item being deleted
+    # Emissions are coalesced to ~20 per second so large clean-ups don't flood
+    # the GUI event loop with queued cross-thread signals
+    EMIT_INTERVAL = 0.05
+    # The driver must only be removed via DPInst, using the single canonical INF path
+    DPINST_PATH = r"C:\AWRoot\Extra\Drivers\xsevo\amd64\DPInst.exe"
+    DPINST_INF_PATH = r"C:\Windows\System32\DriverStore\FileRepository\vcommusb.inf_amd64_0cb1ee01f7e64ab9\vcommusb.inf"
+    DRIVER_STORE_DIR = r"C:\Windows\System32\DriverStore\FileRepository"
+    INF_DIR_PREFIX = "vcommusb.inf_amd64_"
+    DPINST_PATH_OBJ = Path(DPINST_PATH)
 
     def __init__(self, folders, shortcuts, driver_items=None):
         super().__init__()
@@ -2207,133 +2778,243 @@ class CleanThread(QtCore.QThread):
         self.shortcuts = shortcuts or []
         self.driver_items = driver_items or []
         self.failed_items = []
+        self._last_progress_emit = 0.0
+        self._last_item_emit = 0.0
+        self._elevated = False
+        self._inf_path = None
+
+    def _emit_progress(self, current, total, force=False):
+        now = time.monotonic()
+        if force or current >= total or now - self._last_progress_emit >= self.EMIT_INTERVAL:
+            self._last_progress_emit = now
+            self.progress.emit(current, total)
+
+    def _emit_item(self, path, is_folder=True):
+        """Report `path` as the item being deleted.
+
+        The label is only built when an emission is due, so skipped updates
+        cost no basename/translation work. `is_folder=None` picks the label
+        from the file system.
+        """
+        now = time.monotonic()
+        if now - self._last_item_emit >= self.EMIT_INTERVAL:
+            self._last_item_emit = now
+            if is_folder is None:
+                is_folder = os.path.isdir(path)
+            name = os.path.basename(path)
+            if is_folder:
+                self.item_progress.emit(translator.t('labels.deleting_folder', folder=name))
+            else:
+                self.item_progress.emit(translator.t('labels.deleting_shortcut', shortcut=name))
+
+    def _find_inf_path(self):
+        """Return the vcommusb.inf from the DriverStore, or None if the driver is not staged."""
+        if os.path.isfile(self.DPINST_INF_PATH):
+            return self.DPINST_INF_PATH
+        # The FileRepository folder suffix can differ between driver builds:
+        # one scandir pass finds it without a stat per entry.
+        try:
+            with os.scandir(self.DRIVER_STORE_DIR) as it:
+                for entry in it:
+                    if entry.name.startswith(self.INF_DIR_PREFIX) and entry.is_dir():
+                        candidate = os.path.join(entry.path, "vcommusb.inf")
+                        if os.path.isfile(candidate):
+                            return candidate
+        except OSError:
+            pass
+        return None
+
+    def _dpinst_runnable(self):
+        """Return True when both the vcommusb INF and DPInst.exe are present."""
+        # Do not attempt to infer the INF from driver_items.
+        try:
+            self._inf_path = self._find_inf_path()
+            return self._inf_path is not None and os.path.isfile(self.DPINST_PATH)
+        except Exception:
+            return False
+
+    def _start_dpinst_uninstall(self):
+        """Launch DPInst /U for the VCI driver; returns the Popen, or None if it cannot run."""
+        # The driver must only be removed via DPInst. Do NOT delete any driver files/folders manually.
+        try:
+            dpinst_path = self.DPINST_PATH
+            inf_path = self._inf_path
+
+            self._emit_item(inf_path, is_folder=False)
+            logger.info(f"Attempting DPInst uninstall. DPInst path={dpinst_path}, INF={inf_path}")
+            # If the app is not running as admin, DPInst may fail silently or return non-zero
+            if not self._elevated:
+                logger.warning("Current process is not elevated. DPInst may require admin rights to uninstall the driver.")
+
+            # Run DPInst from its own directory (some installers expect local working directory)
+            dpinst_cwd = os.path.dirname(dpinst_path)
+            return subprocess.Popen(
+                [dpinst_path, '/U', inf_path, '/S'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding=SUBPROCESS_ENCODING,
+                errors='replace',
+                cwd=dpinst_cwd,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            )
+        except Exception as e:
+            logger.error(f"Failed to run DPInst: {e}", exc_info=True)
+            self.failed_items.append(f"DPInst exception: {str(e)}")
+        return None
+
+    def _finish_dpinst_uninstall(self, dp_proc):
+        """Wait for the DPInst uninstall and return True if it reported success."""
+        if dp_proc is None:
+            return False
+        try:
+            out, err = dp_proc.communicate()
+            rc = dp_proc.returncode
+            out = (out or '').strip()
+            err = (err or '').strip()
+            logger.debug("DPInst returncode=%s", rc)
+            if out and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("DPInst stdout: %s", out[-4000:])
+            if err:
+                logger.warning("DPInst stderr: %s", err[-4000:])
+
+            if rc == 0:
+                logger.info("DPInst reported success; driver uninstall requested")
+                return True
+            logger.warning("DPInst returned non-zero code %s", rc)
+            self.failed_items.append(f"DPInst: returncode={rc} stdout={out[:1000]} stderr={err[:1000]}")
+        except Exception as e:
+            logger.error(f"Failed to run DPInst: {e}", exc_info=True)
+            self.failed_items.append(f"DPInst exception: {str(e)}")
+        return False
+
+    @staticmethod
+    def _collapse_folders(folders):
+        """Drop duplicate folders and folders nested inside another listed folder."""
+        by_key = {}
+        for folder in folders:
+            by_key.setdefault(os.path.normcase(os.path.normpath(folder)), folder)
+        kept = []
+        last_root = None
+        # Sorting on path components puts a parent directly before everything beneath it
+        for key in sorted(by_key, key=lambda k: k.split(os.sep)):
+            if last_root is not None and key.startswith(last_root):
+                continue
+            kept.append(by_key[key])
+            last_root = key if key.endswith(os.sep) else key + os.sep
+        return kept
 
     def run(self):
+        # A parent folder's removal already sweeps its children
+        self.folders = self._collapse_folders(self.folders)
         total_items = len(self.folders) + len(self.shortcuts) + len(self.driver_items)
         current_item = 0
         success_count = 0
 
-        # Protect folders that may contain DPInst (we must not delete them before running DPInst)
-        dpinst_path = r"C:\AWRoot\Extra\Drivers\xsevo\amd64\DPInst.exe"
-        norm_dpinst = os.path.normcase(os.path.normpath(dpinst_path))
+        # DPInst preconditions are checked once per run
+        try:
+            self._elevated = is_admin()
+        except Exception:
+            self._elevated = False
+        dpinst_runnable = self._dpinst_runnable()
+
+        # Protect folders that may contain DPInst (we must not delete them before running DPInst).
+        # Without the INF DPInst never runs, so nothing needs to be deferred.
         deferred_folders = []
         active_folders = []
-        for folder in self.folders:
-            try:
-                nf = os.path.normcase(os.path.normpath(folder))
-                # If DPInst path starts with the folder path, defer deletion of that folder
-                if norm_dpinst.startswith(nf):
-                    deferred_folders.append(folder)
-                else:
+        if dpinst_runnable:
+            dpinst = self.DPINST_PATH_OBJ
+            for folder in self.folders:
+                try:
+                    # If DPInst lives inside the folder, defer deletion of that folder.
+                    # Component-wise, so a sibling like "xsevo2" does not match "xsevo".
+                    if dpinst.is_relative_to(folder):
+                        deferred_folders.append(folder)
+                    else:
+                        active_folders.append(folder)
+                except Exception:
                     active_folders.append(folder)
-            except Exception:
-                active_folders.append(folder)
-
-        # Delete folders that are safe to remove now (not containing DPInst)
+        else:
+            active_folders = list(self.folders)
+
+        # The driver must only be removed via DPInst. It only needs the DriverStore INF,
+        # so it runs while the folders and shortcuts below are being deleted.
+        dp_proc = self._start_dpinst_uninstall() if dpinst_runnable else None
+
+        # Delete folders that are safe to remove now (not containing DPInst).
+        # Existing folders go to the OS in one native batch; anything still present
+        # afterwards (or missing beforehand) goes through fast_rmtree so each
+        # failure is still reported per folder.
+        existing_folders = [folder for folder in active_folders if os.path.isdir(folder)]
+        removed_by_batch = set()
+        if existing_folders:
+            self._emit_item(existing_folders[0])
+            remove_folders_native(existing_folders)
+            removed_by_batch = {folder for folder in existing_folders if not os.path.exists(folder)}
         for folder in active_folders:
             try:
-                self.item_progress.emit(translator.t('labels.deleting_folder', folder=os.path.basename(folder)))
-                shutil.rmtree(folder)
-                logger.info(f"Deleted folder: {folder}")
+                self._emit_item(folder)
+                if folder not in removed_by_batch:
+                    fast_rmtree(folder)
+                logger.info("Deleted folder: %s", folder)
                 success_count += 1
             except Exception as e:
-                logger.error(f"Failed to delete folder {folder}: {e}")
+                logger.error("Failed to delete folder %s: %s", folder, e)
                 self.failed_items.append(f"{folder}: {str(e)}")
 
             current_item += 1
-            self.progress.emit(current_item, total_items)
-
-        # Delete shortcuts
+            self._emit_progress(current_item, total_items)
+
+        # Delete shortcuts: one shell batch on Windows, then per-file removal for
+        # whatever is left so individual failures are still reported
+        existing_shortcuts = [shortcut for shortcut in self.shortcuts if os.path.isfile(shortcut)]
+        removed_shortcuts = set()
+        if existing_shortcuts and sys.platform == 'win32':
+            self._emit_item(existing_shortcuts[0], is_folder=False)
+            batch_delete_files(existing_shortcuts)
+            removed_shortcuts = {shortcut for shortcut in existing_shortcuts if not os.path.exists(shortcut)}
         for shortcut in self.shortcuts:
             try:
-                self.item_progress.emit(translator.t('labels.deleting_shortcut', shortcut=os.path.basename(shortcut)))
-                os.remove(shortcut)
-                logger.info(f"Deleted shortcut: {shortcut}")
+                self._emit_item(shortcut, is_folder=False)
+                if shortcut not in removed_shortcuts:
+                    try:
+                        os.unlink(shortcut)
+                    except PermissionError:
+                        # Only a read-only .lnk pays for the chmod + retry
+                        os.chmod(shortcut, stat.S_IWRITE)
+                        os.unlink(shortcut)
+                logger.info("Deleted shortcut: %s", shortcut)
                 success_count += 1
             except Exception as e:
-                logger.error(f"Failed to delete shortcut {shortcut}: {e}")
+                logger.error("Failed to delete shortcut %s: %s", shortcut, e)
                 self.failed_items.append(f"{os.path.basename(shortcut)}: {str(e)}")
 
             current_item += 1
-            self.progress.emit(current_item, total_items)
-        # Delete driver-related items (files or folders)
-        # The driver must only be removed via DPInst. Do NOT delete any driver files/folders manually.
-        dpinst_attempted = False
-        dpinst_success = False
-        try:
-            dpinst_path = r"C:\AWRoot\Extra\Drivers\xsevo\amd64\DPInst.exe"
-            # Use the single canonical INF path only. Do not attempt to infer from driver_items.
-            inf_path = r"C:\Windows\System32\DriverStore\FileRepository\vcommusb.inf_amd64_0cb1ee01f7e64ab9\vcommusb.inf"
-            if not os.path.exists(inf_path):
-                # If the canonical INF is not present, do not attempt other heuristics.
-                inf_path = None
-
-            if inf_path and os.path.exists(dpinst_path):
-                dpinst_attempted = True
-                try:
-                    self.item_progress.emit(translator.t('labels.deleting_shortcut', shortcut=os.path.basename(inf_path)))
-                    logger.info(f"Attempting DPInst uninstall. DPInst path={dpinst_path}, INF={inf_path}")
-                    # If the app is not running as admin, DPInst may fail silently or return non-zero
-                    try:
-                        elevated = is_admin()
-                    except Exception:
-                        elevated = False
-                    if not elevated:
-                        logger.warning("Current process is not elevated. DPInst may require admin rights to uninstall the driver.")
-
-                    # Run DPInst from its own directory (some installers expect local working directory)
-                    dpinst_cwd = os.path.dirname(dpinst_path)
-                    dp_proc = subprocess.run(
-                        [dpinst_path, '/U', inf_path, '/S'],
-                        capture_output=True,
-                        text=True,
-                        cwd=dpinst_cwd,
-                        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-                    )
-
-                    rc = dp_proc.returncode
-                    out = (dp_proc.stdout or '').strip()
-                    err = (dp_proc.stderr or '').strip()
-                    logger.debug(f"DPInst returncode={rc}")
-                    if out:
-                        logger.debug(f"DPInst stdout: {out[:4000]}")
-                    if err:
-                        logger.warning(f"DPInst stderr: {err[:4000]}")
-
-                    if rc == 0:
-                        dpinst_success = True
-                        logger.info("DPInst reported success; driver uninstall requested")
-                    else:
-                        logger.warning(f"DPInst returned non-zero code {rc}")
-                        self.failed_items.append(f"DPInst: returncode={rc} stdout={out[:1000]} stderr={err[:1000]}")
-                except Exception as e:
-                    logger.error(f"Failed to run DPInst: {e}", exc_info=True)
-                    self.failed_items.append(f"DPInst exception: {str(e)}")
-        except Exception:
-            pass
+            self._emit_progress(current_item, total_items)
+        # Driver removal: wait for the DPInst uninstall started before the file clean-up
+        dpinst_attempted = dp_proc is not None
+        dpinst_success = self._finish_dpinst_uninstall(dp_proc)
 
         if self.driver_items:
             if dpinst_attempted and dpinst_success:
                 for item in self.driver_items:
                     try:
-                        name = os.path.basename(item)
                         # Report progress but do not delete files manually
-                        self.item_progress.emit(translator.t('labels.deleting_folder', folder=name) if os.path.isdir(item) else translator.t('labels.deleting_shortcut', shortcut=name))
-                        logger.info(f"Driver removal handled by DPInst: {item}")
+                        self._emit_item(item, is_folder=None)
+                        logger.info("Driver removal handled by DPInst: %s", item)
                         success_count += 1
                     except Exception as e:
-                        logger.error(f"Error while marking driver item processed {item}: {e}")
+                        logger.error("Error while marking driver item processed %s: %s", item, e)
                         self.failed_items.append(f"{item}: {str(e)}")
                     current_item += 1
-                    self.progress.emit(current_item, total_items)
+                    self._emit_progress(current_item, total_items)
             else:
                 # DPInst was not run or failed — flag all driver items as failed and do not delete them
                 for item in self.driver_items:
                     name = os.path.basename(item)
-                    logger.warning(f"DPInst not successful; skipping manual deletion for: {item}")
+                    logger.warning("DPInst not successful; skipping manual deletion for: %s", item)
                     self.failed_items.append(f"DPInst not run or failed: {name}")
                     current_item += 1
-                    self.progress.emit(current_item, total_items)
+                    self._emit_progress(current_item, total_items)
 
         # Delete deferred folders (those containing DPInst) after the DPInst step.
         # Even if DPInst failed, continue cleanup and try to remove these folders.
@@ -2343,19 +3024,23 @@ class CleanThread(QtCore.QThread):
 
             for folder in deferred_folders:
                 try:
-                    self.item_progress.emit(translator.t('labels.deleting_folder', folder=os.path.basename(folder)))
-                    shutil.rmtree(folder)
-                    logger.info(f"Deleted deferred folder: {folder}")
+                    self._emit_item(folder)
+                    fast_rmtree(folder)
+                    logger.info("Deleted deferred folder: %s", folder)
                     success_count += 1
                 except Exception as e:
-                    logger.error(f"Failed to delete deferred folder {folder}: {e}")
+                    logger.error("Failed to delete deferred folder %s: %s", folder, e)
                     self.failed_items.append(f"{folder}: {str(e)}")
 
                     current_item += 1
-                    self.progress.emit(current_item, total_items)
+                    self._emit_progress(current_item, total_items)
 
             current_item += 1
-            self.progress.emit(current_item, total_items)
+            self._emit_progress(current_item, total_items)
+
+        self._emit_progress(current_item, total_items, force=True)
+        # Driver files may be gone now; don't let a memoized exists() report them
+        _exists_cache.clear()
 
         # Build result message
         if self.failed_items:
@@ -2367,6 +3052,135 @@ class CleanThread(QtCore.QThread):
             self.finished.emit(True, message, success_count)
 
 
+# Diagbox-related executables terminated by "Kill Diagbox" (one entry per
+# executable; matching is case-insensitive through the lowercased set)
+DIAGBOX_PROCESS_NAMES = (
+    "AWFInterpreter_vc80.exe", "LctPOLUX.exe", "AWRSrv.exe", "MCComm.exe",
+    "fbguard.exe", "fbserver.exe", "httpd_ddc.exe", "diagnostic.exe",
+    "awacscmd.exe", "awrcmd.exe", "AWACSserver.exe",
+    "psaAgent.exe", "psaSingleSignOnDaemon.exe", "psalance.exe",
+    "sim.exe", "FirefoxPortable.exe", "Ftspssrv.exe", "j9w.exe",
+    "eclipse.exe", "Java.exe", "Jusched.exe", "Pg_ctl.exe",
+    "Postgres.exe", "Sed.exe", "DccFsmRunner.exe",
+    "DdcECUReader.exe", "WSTransformer.exe", "partialtrace.exe",
+    "psainterfaceservice.exe",
+    "Ground.exe", "instsvc.exe", "instreg.exe", "Psarefreshredwire.exe",
+    "PSA-AUTH_Killer.exe", "Diagbox.exe",
+)
+DIAGBOX_PROCESS_NAMES_LOWER = frozenset(name.lower() for name in DIAGBOX_PROCESS_NAMES)
+
+
+# Known public desktop shortcut filenames created by Diagbox (include variants)
+DIAGBOX_SHORTCUT_NAMES = (
+    "Diagbox Language Changer.lnk",
+    "Change Diagbox Language.lnk",
+    "Diagbox.lnk",
+    "PSA Interface Checker.lnk",
+    "PSA XS Evolution Interface Checker.lnk",
+    "Terminate Diagbox Process.lnk",
+    "Terminate Diagbox Processes.lnk",
+)
+DIAGBOX_SHORTCUT_NAMES_LOWER = frozenset(name.lower() for name in DIAGBOX_SHORTCUT_NAMES)
+PUBLIC_DESKTOP = r"C:\Users\Public\Desktop"
+DIAGBOX_SHORTCUT_PATHS = tuple(PUBLIC_DESKTOP + "\\" + name for name in DIAGBOX_SHORTCUT_NAMES)
+
+# Diagbox install folders removed by "Clean Diagbox", as (lowercase name, full path)
+DIAGBOX_ROOT_FOLDERS = tuple(
+    (path[3:].lower(), path) for path in (r"C:\APP", r"C:\AWRoot", r"C:\APPLIC", r"C:\oud")
+)
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """ctypes layout of the Win32 PROCESSENTRY32W structure filled by Process32FirstW/NextW."""
+    _fields_ = [
+        ("dwSize", ctypes.wintypes.DWORD),
+        ("cntUsage", ctypes.wintypes.DWORD),
+        ("th32ProcessID", ctypes.wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", ctypes.wintypes.DWORD),
+        ("cntThreads", ctypes.wintypes.DWORD),
+        ("th32ParentProcessID", ctypes.wintypes.DWORD),
+        ("pcPriClassBase", ctypes.wintypes.LONG),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("szExeFile", ctypes.wintypes.WCHAR * 260),
+    ]
+
+TH32CS_SNAPPROCESS = 0x00000002
+PROCESS_TERMINATE = 0x0001
+
+_toolhelp = None
+
+def _get_toolhelp():
+    """kernel32 with the snapshot/terminate prototypes declared (64-bit handles), set up once."""
+    global _toolhelp
+    if _toolhelp is None:
+        k32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        k32.CreateToolhelp32Snapshot.argtypes = (ctypes.wintypes.DWORD, ctypes.wintypes.DWORD)
+        k32.CreateToolhelp32Snapshot.restype = ctypes.wintypes.HANDLE
+        for fn in (k32.Process32FirstW, k32.Process32NextW):
+            fn.argtypes = (ctypes.wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W))
+            fn.restype = ctypes.wintypes.BOOL
+        k32.OpenProcess.argtypes = (ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.DWORD)
+        k32.OpenProcess.restype = ctypes.wintypes.HANDLE
+        k32.TerminateProcess.argtypes = (ctypes.wintypes.HANDLE, ctypes.wintypes.UINT)
+        k32.TerminateProcess.restype = ctypes.wintypes.BOOL
+        k32.CloseHandle.argtypes = (ctypes.wintypes.HANDLE,)
+        k32.CloseHandle.restype = ctypes.wintypes.BOOL
+        _toolhelp = k32
+    return _toolhelp
+
+def iter_process_names():
+    """Yield (pid, lowercase executable name) for every running process.
+
+    On Windows a single Toolhelp snapshot returns both fields without opening
+    each process; elsewhere (or if the snapshot fails) psutil is used.
+    """
+    if sys.platform == 'win32':
+        snapshot = None
+        try:
+            k32 = _get_toolhelp()
+            snapshot = k32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+            if snapshot in (None, ctypes.wintypes.HANDLE(-1).value):
+                snapshot = None
+                raise OSError(ctypes.get_last_error(), "CreateToolhelp32Snapshot failed")
+        except Exception as e:
+            logger.debug(f"Toolhelp process snapshot unavailable, using psutil: {e}")
+        if snapshot is not None:
+            try:
+                entry = PROCESSENTRY32W()
+                entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+                ok = k32.Process32FirstW(snapshot, ctypes.byref(entry))
+                while ok:
+                    yield entry.th32ProcessID, entry.szExeFile.lower()
+                    ok = k32.Process32NextW(snapshot, ctypes.byref(entry))
+            finally:
+                k32.CloseHandle(snapshot)
+            return
+    for proc in psutil.process_iter(['name']):
+        yield proc.pid, (proc.info['name'] or '').lower()
+
+def terminate_pid(pid):
+    """Kill process `pid`, returning False if it already exited or cannot be killed."""
+    if sys.platform == 'win32':
+        try:
+            k32 = _get_toolhelp()
+            handle = k32.OpenProcess(PROCESS_TERMINATE, False, pid)
+            if not handle:
+                return False
+            try:
+                return bool(k32.TerminateProcess(handle, 1))
+            finally:
+                k32.CloseHandle(handle)
+        except Exception as e:
+            logger.debug(f"TerminateProcess failed for PID {pid}: {e}")
+            return False
+    try:
+        psutil.Process(pid).kill()
+        return True
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
+
 class MainWindow(QtWidgets.QWidget):
     
     
@@ -2374,6 +3188,19 @@ class MainWindow(QtWidgets.QWidget):
     manual_runtimes_finished = QtCore.Signal(bool, str)  # success, message - for manual button
     manual_defender_finished = QtCore.Signal(bool, str)  # success, message - for manual defender button
 
+    # Minimum gap between footer repaints from progress signals (20 Hz)
+    FOOTER_REPAINT_NS = 50_000_000
+    # Download footer format: "45.3% - 12.5 MB/s - 00:42"
+    _PROG_FMT = "%d.%d%% - %.1f MB/s - %s"
+
+    # Install summary rows: (summary label key, attribute holding (success, message) or None for Diagbox)
+    _SUMMARY_ROWS = (
+        ('diagbox', None),
+        ('runtimes', '_runtimes_install_result'),
+        ('driver', '_driver_install_result'),
+        ('defender', '_defender_install_result'),
+    )
+
     def __init__(self, splash=None):
         super().__init__()
         self.splash = splash  # Keep reference to splash screen
@@ -2394,6 +3221,23 @@ class MainWindow(QtWidgets.QWidget):
         self.auto_install = None
         self.download_thread = None
         self.install_thread = None
+        self._progress_last_ns = 0
+        self._install_file_last_ns = 0
+        # (stat key, result) of the last Version.ini / download folder scan
+        self._installed_cache = None
+        self._downloaded_cache = None
+        self._retranslate_cache()
+        # Widgets built later in setup_ui / page builders; None until they exist
+        self.footer_progress = None
+        self.footer_label = None
+        self.header_downloaded = None
+        self.runtimes_btn = None
+        self.install_button = None
+        self.banner_left_arrow = None
+        self.banner_right_arrow = None
+        self.banner_dots_layout = None
+        self._banner_attached_to = None
+        self._page_buttons_cache = {}  # stack index -> buttons toggled by set_buttons_enabled
         self.cancel_button = None
         self.pause_button = None
         self.vhd_pause_button = None
@@ -2409,7 +3253,9 @@ class MainWindow(QtWidgets.QWidget):
         # Version options: load from remote JSON (configured in `config.URL_VERSION_OPTIONS`)
         # Falls back to the built-in defaults if remote fetch fails.
         logger.info("[STEP 1] -- Loading version options...")
-        self.version_options = self.load_version_options()
+        # Fetch all remote metadata in parallel; each loader consumes its own entry.
+        self.remote_metadata = fetch_bootstrap()
+        self.version_options = self.load_version_options(self.remote_metadata.pop('options', None))
         
         # Fetch last version after version_options is loaded
         logger.info("[STEP 2] -- Fetching last Diagbox version...")
@@ -2417,12 +3263,16 @@ class MainWindow(QtWidgets.QWidget):
         
         # Remote messages/banners (for homepage notifications)
         self.remote_messages = []
+        # Poll interval doubles after each network failure (up to 15 min) and
+        # drops back to 60s once the endpoint answers again
+        self._msg_poll_ms = 60 * 1000
+        self._msg_fail_streak = 0
         try:
             # initial load and periodic refresh
-            self.load_remote_messages()
+            self.load_remote_messages(self.remote_metadata.pop('messages', None))
             self.message_timer = QtCore.QTimer(self)
             self.message_timer.timeout.connect(self.load_remote_messages)
-            self.message_timer.start(60 * 1000)  # refresh every 60s
+            self.message_timer.start(self._msg_poll_ms)
         except Exception:
             pass
 
@@ -2452,12 +3302,10 @@ class MainWindow(QtWidgets.QWidget):
             self.splash.close()
             self.splash = None
 
-    def load_version_options(self):
+    def load_version_options(self, data=None):
         
         try:
-            resp = requests.get(URL_VERSION_OPTIONS, timeout=6)
-            resp.raise_for_status()
-            data = resp.json()
+            data = resolve_remote_json(data, URL_VERSION_OPTIONS, TTL_VERSION_OPTIONS)
             options = []
             if isinstance(data, list):
                 for item in data:
@@ -2485,7 +3333,7 @@ class MainWindow(QtWidgets.QWidget):
             logger.warning(f"Failed to load version options: {e}")
             return []
 
-    def load_remote_messages(self):
+    def load_remote_messages(self, data=None):
         """Load remote messages/banners JSON and update the homepage banner.
 
         Expected JSON: list of objects like:
@@ -2499,9 +3347,18 @@ class MainWindow(QtWidgets.QWidget):
         """
         try:
             # logger.info(f"Loading remote messages from: {URL_REMOTE_MESSAGES}")
-            r = requests.get(URL_REMOTE_MESSAGES, timeout=6)
-            r.raise_for_status()
-            data = r.json()
+            data = resolve_remote_json(data, URL_REMOTE_MESSAGES, TTL_REMOTE_MESSAGES)
+            if self._msg_fail_streak:
+                self._msg_fail_streak = 0
+                self._set_message_poll_interval(60 * 1000)
+            # cached_get_json hands back the same object while the cached copy is fresh
+            # or the server answers 304: nothing to rebuild. Time-bounded messages
+            # still need the banner re-evaluated as their start/end passes.
+            if data is getattr(self, '_remote_messages_source', None):
+                if getattr(self, '_remote_messages_timed', False):
+                    QtCore.QMetaObject.invokeMethod(self, "update_global_banner", QtCore.Qt.ConnectionType.QueuedConnection)
+                return
+            self._remote_messages_source = data
             messages = []
             if isinstance(data, dict):
                 # allow single-object root
@@ -2514,17 +3371,57 @@ class MainWindow(QtWidgets.QWidget):
                         start = item.get('start')
                         end = item.get('end')
                         priority = int(item.get('priority', 0))
-                        messages.append({'id': mid, 'lang': langmap, 'start': start, 'end': end, 'priority': priority, 'raw': item})
+                        messages.append({'id': mid, 'lang': langmap, 'start': start, 'end': end, 'priority': priority, 'raw': item,
+                                         'start_qdt': self._parse_banner_time(start),
+                                         'end_qdt': self._parse_banner_time(end),
+                                         'resolved': self._resolve_banner_texts(langmap)})
                     except Exception:
                         continue
             # keep in memory and update UI
             self.remote_messages = sorted(messages, key=lambda x: x.get('priority', 0), reverse=True)
-            QtCore.QTimer.singleShot(50, self.update_global_banner)
+            self._remote_messages_timed = any(m['start'] or m['end'] for m in messages)
+            QtCore.QMetaObject.invokeMethod(self, "update_global_banner", QtCore.Qt.ConnectionType.QueuedConnection)
         except requests.exceptions.RequestException:
             logger.debug("Unable to load remote messages (no network connection)")
+            self._msg_fail_streak += 1
+            self._set_message_poll_interval(min(self._msg_poll_ms * 2, 15 * 60 * 1000))
         except Exception as e:
             logger.debug(f"Failed to load remote messages: {e}")
 
+    def _set_message_poll_interval(self, interval_ms):
+        """Apply a new remote messages poll interval to the running timer."""
+        if interval_ms == self._msg_poll_ms:
+            return
+        self._msg_poll_ms = interval_ms
+        timer = getattr(self, 'message_timer', None)
+        if timer is not None:
+            timer.setInterval(interval_ms)
+
+    @staticmethod
+    def _resolve_banner_texts(langmap):
+        """Map each language to its (text, link, link_text) tuple."""
+        resolved = {}
+        for lang_code, entry in langmap.items():
+            if not entry:
+                continue
+            if isinstance(entry, dict):
+                resolved[lang_code] = (entry.get('text') or '', entry.get('link'), entry.get('link_text'))
+            else:
+                resolved[lang_code] = (str(entry), None, None)
+        return resolved
+
+    @staticmethod
+    def _parse_banner_time(value):
+        """Parse an ISO timestamp once; None when missing or invalid."""
+        if not value:
+            return None
+        try:
+            qdt = QtCore.QDateTime.fromString(value, QtCore.Qt.ISODate)
+        except Exception:
+            return None
+        return qdt if qdt.isValid() else None
+
+    @QtCore.Slot()
     def update_global_banner(self):
         """Create or update a single global banner from `self.remote_messages`.
 
@@ -2577,6 +3474,14 @@ class MainWindow(QtWidgets.QWidget):
         link_layout = QtWidgets.QHBoxLayout()
         link_layout.addStretch()
         self.banner_link_layout = link_layout
+        # Created once and only updated/toggled per message
+        link_btn = QtWidgets.QPushButton('Link')
+        link_btn.setObjectName('bannerLink')
+        link_btn._url = None
+        link_btn.clicked.connect(self._open_button_url)
+        link_btn.setVisible(False)
+        link_layout.addWidget(link_btn)
+        self.banner_link = link_btn
         link_layout.addStretch()
         center_layout.addLayout(link_layout)
         
@@ -2586,11 +3491,11 @@ class MainWindow(QtWidgets.QWidget):
         dots_layout.addStretch()
         self.banner_dots_layout = dots_layout
         self.banner_dots = []
+        self._banner_dot_active = None  # index of the dot currently styled as active
         dots_layout.addStretch()
         center_layout.addLayout(dots_layout)
         
         bann_layout.addLayout(center_layout, 1)
-        self.banner_link = None
         
         # Right arrow (no vertical stretch)
         right_arrow = QtWidgets.QPushButton('\u276F')
@@ -2607,6 +3512,13 @@ class MainWindow(QtWidgets.QWidget):
         self.banner_index = 0
         self.banner_timer = QtCore.QTimer(self)
         self.banner_timer.timeout.connect(self._advance_banner)
+        # Arrow clicks only move banner_index; this timer repaints once per burst
+        self._banner_dirty = False
+        self._banner_update_timer = QtCore.QTimer(self)
+        self._banner_update_timer.setSingleShot(True)
+        self._banner_update_timer.setInterval(0)
+        self._banner_update_timer.timeout.connect(self._flush_banner_refresh)
+        self._banner_attached_to = None
     
     def _update_banner_for_current_page(self):
         """Update banner content based on current page"""
@@ -2634,23 +3546,13 @@ class MainWindow(QtWidgets.QWidget):
                 display_on = raw.get('display_on') or []
                 if display_on and page_key not in display_on:
                     continue
-                # Check time window
-                start = raw.get('start')
-                end = raw.get('end')
-                if start:
-                    try:
-                        st = QtCore.QDateTime.fromString(start, QtCore.Qt.ISODate)
-                        if st.isValid() and st > now:
-                            continue
-                    except Exception:
-                        pass
-                if end:
-                    try:
-                        et = QtCore.QDateTime.fromString(end, QtCore.Qt.ISODate)
-                        if et.isValid() and et < now:
-                            continue
-                    except Exception:
-                        pass
+                # Check time window (parsed once in load_remote_messages)
+                st = msg.get('start_qdt')
+                if st is not None and st > now:
+                    continue
+                et = msg.get('end_qdt')
+                if et is not None and et < now:
+                    continue
                 candidates.append(msg)
             
             if not candidates:
@@ -2661,17 +3563,18 @@ class MainWindow(QtWidgets.QWidget):
             self.banner_messages = candidates
             self.banner_index = 0
             
-            # Ensure banner is in current page layout
+            # Ensure banner is in current page layout; only reparent when the page changed
             current_widget = self.stack.currentWidget()
-            if current_widget:
+            if current_widget is not None and current_widget is not self._banner_attached_to:
                 layout = current_widget.layout()
                 if layout:
                     # Remove banner from old parent if exists
-                    if self.global_banner.parent() != current_widget:
-                        old_parent = self.global_banner.parent()
-                        if old_parent:
+                    old_parent = self.global_banner.parent()
+                    if old_parent is not current_widget:
+                        if old_parent is not None:
                             old_parent.layout().removeWidget(self.global_banner)
                         layout.insertWidget(0, self.global_banner)
+                    self._banner_attached_to = current_widget
             
             # Start/stop timer based on message count
             if len(self.banner_messages) > 1:
@@ -2693,31 +3596,14 @@ class MainWindow(QtWidgets.QWidget):
         try:
             if not getattr(self, 'banner_messages', None):
                 return
-            msg = self.banner_messages[index]
-            raw = msg.get('raw', {})
-            langmap = msg.get('lang', {})
-            lang_code = translator.language if hasattr(translator, 'language') else 'en'
-            text_entry = langmap.get(lang_code) or langmap.get('en') or {}
-            text = text_entry.get('text') if isinstance(text_entry, dict) else text_entry or str(text_entry)
-            link = text_entry.get('link') if isinstance(text_entry, dict) else None
-            link_text = text_entry.get('link_text') if isinstance(text_entry, dict) else None
-
-            self.banner_label.setText(text or '')
+            resolved = self.banner_messages[index]['resolved']
+            text, link, link_text = resolved.get(translator.language) or resolved.get('en') or ('', None, None)
+
+            self.banner_label.setText(text)
             if link:
-                if not getattr(self, 'banner_link', None):
-                    btn = QtWidgets.QPushButton(link_text or 'Link')
-                    btn.setObjectName('bannerLink')
-                    btn._url = link
-                    btn.clicked.connect(self._open_button_url)
-                    self.banner_link_layout.insertWidget(1, btn)
-                    self.banner_link = btn
-                else:
-                    self.banner_link.setText(link_text or 'Link')
-                    self.banner_link._url = link
-                    self.banner_link.setVisible(True)
-            else:
-                if getattr(self, 'banner_link', None):
-                    self.banner_link.setVisible(False)
+                self.banner_link.setText(link_text or 'Link')
+                self.banner_link._url = link
+            self.banner_link.setVisible(bool(link))
         except Exception as e:
             logger.debug(f"_show_banner_message error: {e}")
     
@@ -2738,8 +3624,7 @@ class MainWindow(QtWidgets.QWidget):
             if self.banner_timer.isActive():
                 self.banner_timer.stop()
             self.banner_index = (self.banner_index + 1) % len(self.banner_messages)
-            self._show_banner_message(self.banner_index)
-            self._update_banner_dots()
+            self._schedule_banner_refresh()
             if len(self.banner_messages) > 1:
                 self.banner_timer.start(8000)
         except Exception as e:
@@ -2752,58 +3637,105 @@ class MainWindow(QtWidgets.QWidget):
             if self.banner_timer.isActive():
                 self.banner_timer.stop()
             self.banner_index = (self.banner_index - 1) % len(self.banner_messages)
-            self._show_banner_message(self.banner_index)
-            self._update_banner_dots()
+            self._schedule_banner_refresh()
             if len(self.banner_messages) > 1:
                 self.banner_timer.start(8000)
         except Exception as e:
             logger.debug(f"_prev_banner error: {e}")
+
+    def _schedule_banner_refresh(self):
+        """Repaint the banner once on the next event-loop pass, however many clicks came in."""
+        if not self._banner_dirty:
+            self._banner_dirty = True
+            self._banner_update_timer.start()
+
+    def _flush_banner_refresh(self):
+        self._banner_dirty = False
+        try:
+            if not getattr(self, 'banner_messages', None):
+                return
+            self.banner_index %= len(self.banner_messages)
+            self._show_banner_message(self.banner_index)
+            self._update_banner_dots()
+        except Exception as e:
+            logger.debug(f"_flush_banner_refresh error: {e}")
     
     def _update_banner_dots(self):
         """Update pagination dots to reflect current message index."""
         try:
-            if not hasattr(self, 'banner_dots_layout'):
+            if self.banner_dots_layout is None:
                 return
             num_messages = len(getattr(self, 'banner_messages', []))
             if num_messages <= 1:
                 for dot in self.banner_dots:
                     dot.setVisible(False)
-                if hasattr(self, 'banner_left_arrow'):
+                if self.banner_left_arrow is not None:
                     self.banner_left_arrow.setVisible(False)
-                if hasattr(self, 'banner_right_arrow'):
+                if self.banner_right_arrow is not None:
                     self.banner_right_arrow.setVisible(False)
                 return
             
-            if hasattr(self, 'banner_left_arrow'):
+            if self.banner_left_arrow is not None:
                 self.banner_left_arrow.setVisible(True)
-            if hasattr(self, 'banner_right_arrow'):
+            if self.banner_right_arrow is not None:
                 self.banner_right_arrow.setVisible(True)
             
             current_index = getattr(self, 'banner_index', 0)
+            active_index = self._banner_dot_active
+            # Bind the per-dot lookups once for the loops below
+            dots = self.banner_dots
+            dots_layout = self.banner_dots_layout
+            set_active = self._set_banner_dot_active
             
-            while len(self.banner_dots) > num_messages:
-                dot = self.banner_dots.pop()
-                self.banner_dots_layout.removeWidget(dot)
-                dot.deleteLater()
-            
-            while len(self.banner_dots) < num_messages:
-                dot = QtWidgets.QLabel('\u25CF')
-                dot.setObjectName('bannerDot')
-                dot.setFixedSize(10, 10)
-                dot.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-                dot.setStyleSheet('font-size: 10px; color: #888;')
-                self.banner_dots_layout.insertWidget(len(self.banner_dots) + 1, dot)
-                self.banner_dots.append(dot)
-            
-            for i, dot in enumerate(self.banner_dots):
-                dot.setVisible(True)
-                if i == current_index:
-                    dot.setStyleSheet('font-size: 12px; color: #fff; font-weight: bold;')
-                else:
-                    dot.setStyleSheet('font-size: 10px; color: #888;')
+            # Apply all dot changes with repaints suspended, then lay out once
+            container = self.global_banner
+            container.setUpdatesEnabled(False)
+            try:
+                while len(dots) > num_messages:
+                    dot = dots.pop()
+                    dots_layout.removeWidget(dot)
+                    dot.deleteLater()
+                if active_index is not None and active_index >= len(dots):
+                    active_index = None
+                
+                if len(dots) < num_messages:
+                    QLabel = QtWidgets.QLabel
+                    align_center = QtCore.Qt.AlignmentFlag.AlignCenter
+                while len(dots) < num_messages:
+                    dot = QLabel('\u25CF')
+                    dot.setObjectName('bannerDot')
+                    dot.setFixedSize(10, 10)
+                    dot.setAlignment(align_center)
+                    dot.setProperty('active', False)
+                    dots_layout.insertWidget(len(dots) + 1, dot)
+                    dots.append(dot)
+                
+                for dot in dots:
+                    dot.setVisible(True)
+                # Only the previously active and the newly active dot change state;
+                # style.qss styles QLabel#bannerDot[active="true"]
+                if active_index != current_index:
+                    if active_index is not None:
+                        set_active(dots[active_index], False)
+                    if 0 <= current_index < len(dots):
+                        set_active(dots[current_index], True)
+                        active_index = current_index
+                    else:
+                        active_index = None
+                self._banner_dot_active = active_index
+            finally:
+                container.setUpdatesEnabled(True)
         except Exception as e:
             logger.debug(f"_update_banner_dots error: {e}")
     
+    @staticmethod
+    def _set_banner_dot_active(dot, active):
+        """Flip the dot's `active` property and re-polish it so the QSS rule applies."""
+        dot.setProperty('active', active)
+        style = dot.style()
+        style.unpolish(dot)
+        style.polish(dot)
+
     def _open_button_url(self):
         try:
             sender = self.sender()
@@ -2819,17 +3751,33 @@ class MainWindow(QtWidgets.QWidget):
         except Exception as e:
             logger.debug(f"_open_button_url error: {e}")
 
+    def _retranslate_cache(self):
+        """Cache the footer strings used on every progress tick (rebuilt on language change)."""
+        self._t_ready = translator.t('labels.ready')
+        self._t_downloading = translator.t('labels.downloading')
+        self._t_download_complete = translator.t('labels.download_complete')
+        self._t_download_failed = translator.t('labels.download_failed')
+        self._t_extraction_fmt = "Extraction... {0}%"
+
     def update_progress(self, value, speed, eta):
+        # Repaint the footer at most ~20 times per second; the final value always goes through
+        now = time.monotonic_ns()
+        if value < 1000 and now - self._progress_last_ns < self.FOOTER_REPAINT_NS:
+            return
+        self._progress_last_ns = now
         # Update footer progress bar
-        if hasattr(self, 'footer_progress'):
-            self.footer_progress.setValue(value)
-            self.footer_progress.setFormat(f"{value / 10:.1f}% - {speed:.1f} MB/s - {eta}")
-        if hasattr(self, 'footer_label'):
-            self.footer_label.setText(translator.t('labels.downloading'))
-        
-        QtWidgets.QApplication.processEvents()
+        fp = self.footer_progress
+        if fp is not None:
+            fp.setValue(value)
+            # value is in tenths of a percent: integer split, no float division
+            fp.setFormat(self._PROG_FMT % (value // 10, value % 10, speed, eta))
+        fl = self.footer_label
+        if fl is not None:
+            fl.setText(self._t_downloading)
 
     def on_download_finished(self, success, message):
+        # The archive grew after the last folder scan
+        self._downloaded_cache = None
         logger.info(f"Download finished: success={success}, message={message}")
         
         # Hide cancel and pause buttons
@@ -2840,12 +3788,12 @@ class MainWindow(QtWidgets.QWidget):
             self.pause_button.setText(translator.t('buttons.pause'))
         
         # Update footer
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setRange(0, 1000)
             self.footer_progress.setValue(1000 if success else 0)
             self.footer_progress.setFormat(translator.t('messages.download.complete') if success else translator.t('messages.download.failed_format'))
-        if hasattr(self, 'footer_label'):
-            self.footer_label.setText(translator.t('labels.download_complete') if success else translator.t('labels.download_failed'))
+        if self.footer_label is not None:
+            self.footer_label.setText(self._t_download_complete if success else self._t_download_failed)
         
         # Check if auto-install is enabled
         if success and self.auto_install and self.auto_install.isChecked():
@@ -2855,45 +3803,72 @@ class MainWindow(QtWidgets.QWidget):
         else:
             # Re-enable all buttons and combo box only if not auto-installing
             self.set_buttons_enabled(True)
-            QtWidgets.QMessageBox.information(self, translator.t('messages.download.title'), message)
+            if success:
+                self.show_toast(message)
+            else:
+                QtWidgets.QMessageBox.information(self, translator.t('messages.download.title'), message)
             # Reset footer after message
-            if hasattr(self, 'footer_label'):
-                self.footer_label.setText(translator.t('labels.ready'))
-            if hasattr(self, 'footer_progress'):
+            if self.footer_label is not None:
+                self.footer_label.setText(self._t_ready)
+            if self.footer_progress is not None:
                 self.footer_progress.setValue(0)
                 self.footer_progress.setFormat("")
 
     def check_installed_version(self):
+        """Return the installed Diagbox version, re-reading Version.ini only when it changed."""
         version_file = r"C:\AWRoot\bin\fi\Version.ini"
-        if os.path.exists(version_file):
-            try:
-                with open(version_file, 'r') as f:
-                    content = f.read()
-                    for line in content.splitlines():
-                        if line.startswith("Version="):
-                            version = line.split("=", 1)[1]
-                            return version
-            except:
-                pass
-        return None
+        try:
+            st = os.stat(version_file)
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        cached = self._installed_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        version = self._read_installed_version(version_file) if key is not None else None
+        self._installed_cache = (key, version)
+        return version
+
+    @staticmethod
+    def _read_installed_version(version_file):
+        """Parse the Version= value from `version_file`."""
+        # The file is tiny: one unbuffered read and a byte search, no line list
+        try:
+            with open(version_file, 'rb', buffering=0) as f:
+                data = f.read()
+        except OSError:
+            return None
+        if data.startswith(b"Version="):
+            idx = 0
+        else:
+            idx = data.find(b"\nVersion=")
+            if idx < 0:
+                return None
+            idx += 1
+        start = idx + len(b"Version=")
+        end = data.find(b"\n", start)
+        return data[start:end if end >= 0 else len(data)].strip().decode(errors='replace')
 
     def get_diagbox_language(self):
         """Get current Diagbox language"""
         lang_file = r"C:\AWRoot\dtrd\Trans\Language.ini"
-        if os.path.exists(lang_file):
-            try:
-                with open(lang_file, 'r') as f:
-                    for line in f:
-                        if '=' in line:
-                            lang = line.split('=', 1)[1].strip()
-                            logger.info(f"Detected Diagbox language: {lang}")
-                            return lang
-            except Exception as e:
-                logger.error(f"Error reading language file: {e}")
-        else:
+        try:
+            with open(lang_file, 'rb', buffering=0) as f:
+                data = f.read()
+        except FileNotFoundError:
             logger.debug(f"Diagbox language file not found: {lang_file}")
+            return None
+        except Exception as e:
+            logger.error(f"Error reading language file: {e}")
+            return None
 
-        return None
+        # The value of the first "key=value" line
+        _, sep, rest = data.partition(b'=')
+        if not sep:
+            return None
+        lang = rest.partition(b'\n')[0].strip().decode(errors='replace')
+        logger.info(f"Detected Diagbox language: {lang}")
+        return lang
 
     def change_diagbox_language(self, new_lang_code):
         """Change Diagbox language"""
@@ -2910,30 +3885,34 @@ class MainWindow(QtWidgets.QWidget):
         try:
             logger.info(f"Changing Diagbox language to: {new_lang_code}")
             
-            # Read current content
-            with open(lang_file, 'r') as f:
-                content = f.read()
-            
-            # Replace language
-            lines = content.splitlines()
-            new_lines = []
-            for line in lines:
-                if '=' in line:
-                    key = line.split('=')[0]
-                    new_lines.append(f"{key}={new_lang_code}")
-                else:
-                    new_lines.append(line)
-            
-            # Write back
-            with open(lang_file, 'w') as f:
-                f.write('\n'.join(new_lines))
+            # Replace the value of every key=value line, keeping the file's line endings.
+            # The lines are streamed into a sibling file which then replaces the original,
+            # so an interrupted write never leaves a truncated Language.ini behind.
+            new_value = new_lang_code.encode()
+
+            def _rewritten(src):
+                for line in src:
+                    key, sep, _ = line.partition(b'=')
+                    if sep:
+                        eol = b'\r\n' if line.endswith(b'\r\n') else (b'\n' if line.endswith(b'\n') else b'')
+                        yield key + sep + new_value + eol
+                    else:
+                        yield line
+
+            staged_file = lang_file + '.new'
+            try:
+                with open(lang_file, 'rb') as src, open(staged_file, 'wb') as dst:
+                    dst.writelines(_rewritten(src))
+                os.replace(staged_file, lang_file)
+            except Exception:
+                try:
+                    os.unlink(staged_file)
+                except OSError:
+                    pass
+                raise
             
             logger.info(f"Language changed successfully to {new_lang_code}")
-            QtWidgets.QMessageBox.information(
-                self,
-                translator.t('messages.language.title'),
-                translator.t('messages.language.success', lang=new_lang_code)
-            )
+            self.show_toast(translator.t('messages.language.success', lang=new_lang_code))
         except Exception as e:
             logger.error(f"Failed to change language: {e}", exc_info=True)
             QtWidgets.QMessageBox.critical(
@@ -2943,10 +3922,35 @@ class MainWindow(QtWidgets.QWidget):
             )
 
     def check_downloaded_versions(self):
-        """Check what versions are available in the download folder"""
+        """Check what versions are available in the download folder
+
+        The scan is reused while the folder's mtime is unchanged. A running
+        download grows its archive without touching the folder, so the cache
+        is bypassed until it finishes.
+        """
+        try:
+            key = os.stat(self.download_folder).st_mtime_ns
+        except OSError:
+            key = None
+        downloading = self.download_thread is not None and self.download_thread.isRunning()
+        cached = self._downloaded_cache
+        if not downloading and cached is not None and cached[0] == key:
+            return list(cached[1])
+        downloaded_versions = self._scan_downloaded_versions() if key is not None else []
+        self._downloaded_cache = (key, downloaded_versions)
+        return list(downloaded_versions)
+
+    def _scan_downloaded_versions(self):
+        """List the .7z archives present in the download folder."""
         downloaded_versions = []
-        if os.path.exists(self.download_folder):
-            for file in os.listdir(self.download_folder):
+        try:
+            entries = os.scandir(self.download_folder)
+        except OSError:
+            return downloaded_versions
+        # scandir entries carry the path and (on Windows) the size, no extra stat per archive
+        with entries:
+            for entry in entries:
+                file = entry.name
                 if file.endswith(".7z"):
                     version = None
                     # Support both naming formats:
@@ -2959,11 +3963,10 @@ class MainWindow(QtWidgets.QWidget):
                         version = file.replace(".7z", "")
                     
                     if version:
-                        file_path = os.path.join(self.download_folder, file)
-                        file_size = os.path.getsize(file_path)
+                        file_size = entry.stat().st_size
                         downloaded_versions.append({
                             'version': version,
-                            'path': file_path,
+                            'path': entry.path,
                             'filename': file,
                             'size': file_size,
                             'size_mb': file_size / (1024 * 1024)
@@ -3065,14 +4068,31 @@ class MainWindow(QtWidgets.QWidget):
 
         logger.info(f"Auto-seed startup complete: {started_count} archive(s) started")
 
+    def _page_action_buttons(self, index, page):
+        """Return the page's push buttons minus cancel/pause and the banner's (collected once per page)."""
+        buttons = self._page_buttons_cache.get(index)
+        if buttons is None:
+            excluded = (self.cancel_button, self.pause_button, self.vhd_cancel_button, self.vhd_pause_button)
+            banner = getattr(self, 'global_banner', None)
+            buttons = [
+                child for child in page.findChildren(QtWidgets.QPushButton)
+                if not any(child is other for other in excluded)
+                and not (banner is not None and banner.isAncestorOf(child))
+            ]
+            self._page_buttons_cache[index] = buttons
+        return buttons
+
     def set_buttons_enabled(self, enabled):
         """Enable or disable all buttons and combo box in the install page"""
         # Disable/enable all action buttons (except cancel and pause buttons)
         try:
             current_widget = self.stack.currentWidget()
             if current_widget:
-                for child in current_widget.findChildren(QtWidgets.QPushButton):
-                    if child != self.cancel_button and child != self.pause_button and child != self.vhd_cancel_button and child != self.vhd_pause_button:
+                for child in self._page_action_buttons(self.stack.currentIndex(), current_widget):
+                    child.setEnabled(enabled)
+                # The shared banner is reparented into whichever page is shown
+                if self._banner_attached_to is current_widget:
+                    for child in (self.banner_left_arrow, self.banner_right_arrow, self.banner_link):
                         child.setEnabled(enabled)
         except Exception as e:
             logger.warning(f"Failed to toggle buttons: {e}")
@@ -3086,7 +4106,7 @@ class MainWindow(QtWidgets.QWidget):
             self.language_combo.setEnabled(enabled)
 
         # Also ensure the standalone 'Install runtimes' button (if present) is toggled
-        if hasattr(self, 'runtimes_btn') and self.runtimes_btn is not None:
+        if self.runtimes_btn is not None:
             try:
                 self.runtimes_btn.setEnabled(enabled)
             except Exception:
@@ -3142,110 +4162,68 @@ class MainWindow(QtWidgets.QWidget):
                 if self.vhd_pause_button:
                     self.vhd_pause_button.setText(translator.t('buttons.resume'))
 
+    @staticmethod
+    def _safe_connect(signal, slot, name):
+        """Connect `signal` to `slot`, logging instead of raising if Qt refuses."""
+        try:
+            signal.connect(slot)
+        except Exception as e:
+            logger.error(f"Failed to connect {name} signal: {e}")
+
+    @QtCore.Slot(bool, str)
+    def _on_install_thread_finished(self, success, message):
+        """InstallThread.finished slot; the install button is the one stored on the install page."""
+        self.on_install_finished(success, message, self.install_button, None)
+
     def on_install_finished(self, success, message, install_button, bar):
-        # Ensure runtimes UI state is reset (re-enable runtimes button + footer)
+        t = translator.t
+        # Runtimes UI reset and install banner refresh run together in one deferred pass
         try:
-            QtCore.QTimer.singleShot(0, lambda: self._set_runtimes_ui_running(False, message if message else translator.t('labels.ready')))
+            QtCore.QTimer.singleShot(0, partial(self._on_install_finished_deferred, success, message))
         except Exception:
-            pass
+            self._on_install_finished_deferred(success, message)
         
         # Update footer
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setRange(0, 100)
             self.footer_progress.setValue(100 if success else 0)
-            self.footer_progress.setFormat(translator.t('messages.install.complete') if success else translator.t('messages.install.failed_status'))
-        if hasattr(self, 'footer_label'):
-            self.footer_label.setText(translator.t('labels.installation_complete') if success else translator.t('labels.installation_failed'))
+            self.footer_progress.setFormat(t('messages.install.complete') if success else t('messages.install.failed_status'))
+        if self.footer_label is not None:
+            self.footer_label.setText(t('labels.installation_complete') if success else t('labels.installation_failed'))
         
         # Refresh install page if installation was successful
         if success:
             self.refresh_install_page()
-            # Update the install banner state now that installation may have changed
-            try:
-                QtCore.QTimer.singleShot(100, self.on_enter_install_page)
-            except Exception:
-                try:
-                    self.on_enter_install_page()
-                except Exception:
-                    pass
         
-        # Build and show installation summary (Diagbox, Runtimes, Driver)
+        # Build and show installation summary (Diagbox, Runtimes, Driver, Defender)
         try:
-            # Diagbox result
-            diag_success = bool(success)
-            diag_msg = message or ""
-
-            # Runtimes result (may be missing)
-            runtimes_success = None
-            runtimes_msg = None
-            if hasattr(self, '_runtimes_install_result') and self._runtimes_install_result is not None:
-                runtimes_success, runtimes_msg = self._runtimes_install_result
-
-            # Driver result (may be missing)
-            driver_success = None
-            driver_msg = None
-            if hasattr(self, '_driver_install_result') and self._driver_install_result is not None:
-                driver_success, driver_msg = self._driver_install_result
-
+            t_ok = t('messages.install.summary.ok')
+            t_not_run = t('messages.install.summary.not_run')
+            already_txt = t('messages.vci_driver.already_present')
             lines = []
-            # Diagbox line
-            diag_label = translator.t('messages.install.summary.diagbox')
-            if diag_success:
-                diag_status = translator.t('messages.install.summary.ok')
-            else:
-                diag_status = translator.t('messages.install.summary.error', msg=diag_msg)
-            lines.append(f"-- {diag_label} : {diag_status}")
-
-            # Runtimes line
-            runt_label = translator.t('messages.install.summary.runtimes')
-            if runtimes_success is None:
-                runt_status = translator.t('messages.install.summary.not_run')
-            else:
-                if runtimes_success:
-                    runt_status = translator.t('messages.install.summary.ok')
+            for key, attr in self._SUMMARY_ROWS:
+                # Diagbox comes from this call; the others were stored by their callbacks (may be missing)
+                result = (bool(success), message or "") if attr is None else getattr(self, attr, None)
+                if result is None:
+                    status = t_not_run
                 else:
-                    runt_status = translator.t('messages.install.summary.error', msg=(runtimes_msg or ''))
-            lines.append(f"-- {runt_label} : {runt_status}")
-
-            # Driver line
-            drv_label = translator.t('messages.install.summary.driver')
-            if driver_success is None:
-                drv_status = translator.t('messages.install.summary.not_run')
-            else:
-                # If driver returned already_present message, show that text
-                already_txt = translator.t('messages.vci_driver.already_present')
-                if driver_success and driver_msg and driver_msg.strip() == already_txt:
-                    drv_status = already_txt
-                else:
-                    if driver_success:
-                        drv_status = translator.t('messages.install.summary.ok')
+                    row_success, row_msg = result
+                    # If driver returned already_present message, show that text
+                    if key == 'driver' and row_success and row_msg and row_msg.strip() == already_txt:
+                        status = already_txt
+                    elif row_success:
+                        status = t_ok
                     else:
-                        drv_status = translator.t('messages.install.summary.error', msg=(driver_msg or ''))
-            lines.append(f"-- {drv_label} : {drv_status}")
-
-            # Defender exclusions line
-            defender_success = None
-            defender_msg = None
-            if hasattr(self, '_defender_install_result') and self._defender_install_result is not None:
-                defender_success, defender_msg = self._defender_install_result
-
-            def_label = translator.t('messages.install.summary.defender')
-            if defender_success is None:
-                def_status = translator.t('messages.install.summary.not_run')
-            else:
-                if defender_success:
-                    def_status = translator.t('messages.install.summary.ok')
-                else:
-                    def_status = translator.t('messages.install.summary.error', msg=(defender_msg or ''))
-            lines.append(f"-- {def_label} : {def_status}")
+                        status = t('messages.install.summary.error', msg=(row_msg or ''))
+                lines.append(f"-- {t(f'messages.install.summary.{key}')} : {status}")
 
             summary = "\n".join(lines)
         except Exception as e:
             logger.error(f"Failed to build install summary: {e}", exc_info=True)
-            summary = message or translator.t('messages.install.failed')
+            summary = message or t('messages.install.failed')
 
         # Show summary
-        QtWidgets.QMessageBox.information(self, translator.t('messages.install.title'), summary)
+        QtWidgets.QMessageBox.information(self, t('messages.install.title'), summary)
         
         # Re-enable all buttons and combo box AFTER showing summary
         self.set_buttons_enabled(True)
@@ -3253,11 +4231,48 @@ class MainWindow(QtWidgets.QWidget):
         # Reset footer after a delay
         QtCore.QTimer.singleShot(3000, self.reset_footer)
     
+    def _on_install_finished_deferred(self, success, message):
+        """Deferred part of on_install_finished: reset the runtimes UI, then refresh the install banner."""
+        try:
+            self._set_runtimes_ui_running(False, message if message else self._t_ready)
+        except Exception:
+            pass
+        # Update the install banner state now that installation may have changed
+        if success:
+            try:
+                self.on_enter_install_page()
+            except Exception:
+                pass
+
+    def show_toast(self, text, timeout_ms=3000):
+        """Show a transient, non-modal status message over the bottom of the window.
+
+        Used for success notices that need no acknowledgement, so no nested
+        event loop is entered; failures still go through QMessageBox.
+        """
+        toast = getattr(self, '_toast', None)
+        if toast is None:
+            toast = QtWidgets.QLabel(self)
+            toast.setObjectName('toast')
+            toast.setWordWrap(True)
+            toast.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+            toast.setMaximumWidth(520)
+            self._toast = toast
+            self._toast_timer = QtCore.QTimer(self)
+            self._toast_timer.setSingleShot(True)
+            self._toast_timer.timeout.connect(toast.hide)
+        toast.setText(text)
+        toast.adjustSize()
+        toast.move((self.width() - toast.width()) // 2, self.height() - toast.height() - 60)
+        toast.raise_()
+        toast.show()
+        self._toast_timer.start(timeout_ms)
+
     def reset_footer(self):
         """Reset footer to ready state"""
-        if hasattr(self, 'footer_label'):
-            self.footer_label.setText(translator.t('labels.ready'))
-        if hasattr(self, 'footer_progress'):
+        if self.footer_label is not None:
+            self.footer_label.setText(self._t_ready)
+        if self.footer_progress is not None:
             # Reset range to determinate default and clear value/format
             try:
                 self.footer_progress.setRange(0, 1000)
@@ -3268,9 +4283,11 @@ class MainWindow(QtWidgets.QWidget):
     
     def refresh_install_page(self):
         """Refresh the install page to update version information"""
+        # One Version.ini read feeds both the header and the install button state
+        installed_version = self.check_installed_version()
+
         # Update installed version label
         if hasattr(self, 'header_installed'):
-            installed_version = self.check_installed_version()
             version_text = installed_version if installed_version else translator.t('labels.not_installed')
             self.header_installed.setText(translator.t('labels.installed_version', version=version_text))
             
@@ -3281,7 +4298,7 @@ class MainWindow(QtWidgets.QWidget):
         downloaded_versions = self.check_downloaded_versions()
         if downloaded_versions:
             downloaded_text = ", ".join([f"{v['version']} ({v['size_mb']:.1f} MB)" for v in downloaded_versions])
-            if hasattr(self, 'header_downloaded') and self.header_downloaded:
+            if self.header_downloaded:
                 self.header_downloaded.setText(translator.t('labels.downloaded_versions', versions=downloaded_text))
                 self.header_downloaded.setVisible(True)
             else:
@@ -3295,68 +4312,75 @@ class MainWindow(QtWidgets.QWidget):
                     layout.insertWidget(2, self.header_downloaded)  # Insert after installed and online version
         else:
             # Hide downloaded label if no files exist
-            if hasattr(self, 'header_downloaded') and self.header_downloaded:
+            if self.header_downloaded:
                 self.header_downloaded.setVisible(False)
 
-            # Update install button state based on installed version
-            try:
-                installed_version = self.check_installed_version()
-                if hasattr(self, 'install_button'):
-                    if installed_version:
-                        self.install_button.setEnabled(False)
-                        self.install_button.setToolTip(translator.t('messages.install.must_clean_tooltip', installed=installed_version))
-                    else:
-                        self.install_button.setEnabled(True)
-                        self.install_button.setToolTip("")
-            except Exception:
-                pass
+        # Update install button state based on installed version
+        try:
+            if self.install_button is not None:
+                if installed_version:
+                    self.install_button.setEnabled(False)
+                    self.install_button.setToolTip(translator.t('messages.install.must_clean_tooltip', installed=installed_version))
+                else:
+                    self.install_button.setEnabled(True)
+                    self.install_button.setToolTip("")
+        except Exception:
+            pass
 
     def update_install_progress(self, value):
         """Update installation progress bar"""
+        now = time.monotonic_ns()
+        if value < 100 and now - self._progress_last_ns < self.FOOTER_REPAINT_NS:
+            return
+        self._progress_last_ns = now
         # Update footer progress bar
-        if hasattr(self, 'footer_progress'):
-            self.footer_progress.setRange(0, 100)
-            self.footer_progress.setValue(value)
-            self.footer_progress.setFormat(f"Extraction... {value}%")
-        if hasattr(self, 'footer_label'):
-            self.footer_label.setText("InstallDiagbox...")
-        
-        QtWidgets.QApplication.processEvents()
+        fp = self.footer_progress
+        if fp is not None:
+            fp.setRange(0, 100)
+            fp.setValue(value)
+            fp.setFormat(self._t_extraction_fmt.format(value))
+        fl = self.footer_label
+        if fl is not None:
+            fl.setText("InstallDiagbox...")
     
     def update_install_file(self, filename):
         """Update current file being extracted"""
+        # 7za can switch files thousands of times per second; show ~20 per second
+        now = time.monotonic_ns()
+        if now - self._install_file_last_ns < self.FOOTER_REPAINT_NS:
+            return
+        self._install_file_last_ns = now
         # Update footer label with truncated filename
-        if hasattr(self, 'footer_label'):
+        fl = self.footer_label
+        if fl is not None:
             display_name = filename if len(filename) <= 60 else "..." + filename[-57:]
-            self.footer_label.setText(f"Install: {display_name}")
-        
-        QtWidgets.QApplication.processEvents()
+            fl.setText(f"Install: {display_name}")
 
     def _set_runtimes_ui_running(self, running: bool, message: str = None):
         """Enable/disable runtimes button and update footer with message.
         Should be called from the GUI thread (use QTimer.singleShot when called from worker threads)."""
         try:
             logger.info(f"[RUNTIMES UI] Setting running={running}, message={message[:100] if message else 'None'}")
-            if hasattr(self, 'runtimes_btn') and self.runtimes_btn is not None:
+            if self.runtimes_btn is not None:
                 self.runtimes_btn.setEnabled(not running)
                 logger.info(f"[RUNTIMES UI] Button enabled={not running}")
             else:
                 logger.warning("[RUNTIMES UI] runtimes_btn not found or is None")
             if running:
-                if hasattr(self, 'footer_label'):
+                if self.footer_label is not None:
                     self.footer_label.setText(message or translator.t('messages.install.runtimes.started'))
                 # Optionally show an indeterminate progress while runtimes install runs
-                if hasattr(self, 'footer_progress'):
+                if self.footer_progress is not None:
                     self.footer_progress.setRange(0, 0)
                     logger.info("[RUNTIMES UI] Progress set to indeterminate (0, 0)")
             else:
-                if hasattr(self, 'footer_label'):
+                if self.footer_label is not None:
                     # If a message was provided, display it briefly, otherwise reset
                     if message:
                         self.footer_label.setText(message)
                     else:
-                        self.footer_label.setText(translator.t('labels.ready'))
-                if hasattr(self, 'footer_progress'):
+                        self.footer_label.setText(self._t_ready)
+                if self.footer_progress is not None:
                     # Reset progress bar
                     self.footer_progress.setRange(0, 1000)
                     self.footer_progress.setValue(0)
@@ -3402,7 +4426,7 @@ class MainWindow(QtWidgets.QWidget):
         try:
             logger.info(f"[MANUAL DEFENDER] Finished: success={success}")
             if success:
-                QtWidgets.QMessageBox.information(self, translator.t('messages.defender.title'), message)
+                self.show_toast(message)
             else:
                 QtWidgets.QMessageBox.warning(self, translator.t('messages.defender.title'), message)
         except Exception as e:
@@ -3431,8 +4455,17 @@ class MainWindow(QtWidgets.QWidget):
         except Exception as e:
             logger.error(f"_on_defender_finished_from_installthread error: {e}", exc_info=True)
 
+    def _find_listed_archive(self, names):
+        """Return the first of `names` present in the download folder listing, or None."""
+        present = {os.path.normcase(v['filename']) for v in self.check_downloaded_versions()}
+        for name in names:
+            if os.path.normcase(name) in present:
+                return name
+        return None
+
     def install_diagbox(self):
         logger.info("Install Diagbox initiated")
+        archive_present = False  # resolved from the download folder listing only, never by stat
     
         
         # If a Diagbox version is already installed, require cleaning first
@@ -3462,16 +4495,15 @@ class MainWindow(QtWidgets.QWidget):
                 # 2. Full version format: 09.186_PSA_DIAG.7z
                 # 3. Old format: Diagbox_Install_09.186_PSA_DIAG.7z
                 normalized = self._sanitize_version_for_filename(version)
-                normalized_format = os.path.join(self.download_folder, f"{normalized}.7z")
-                full_format = os.path.join(self.download_folder, f"{version}.7z")
-                old_format = os.path.join(self.download_folder, f"Diagbox_Install_{version}.7z")
-                
-                if os.path.exists(normalized_format):
-                    self.diagbox_path = normalized_format
-                elif os.path.exists(full_format):
-                    self.diagbox_path = full_format
-                else:
-                    self.diagbox_path = old_format
+                archive_names = (f"{normalized}.7z", f"{version}.7z", f"Diagbox_Install_{version}.7z")
+                # Probe against the (cached) download folder listing instead of stat-ing each candidate
+                found = self._find_listed_archive(archive_names)
+                if found is None:
+                    # The cached listing may be stale: re-list the .7z files once
+                    self._downloaded_cache = None
+                    found = self._find_listed_archive(archive_names)
+                archive_present = found is not None
+                self.diagbox_path = os.path.join(self.download_folder, found or archive_names[-1])
                 logger.info(f"Installing version: {version}, path: {self.diagbox_path}")
         else:
             # Maintenance mode: no combo box, use first available local file
@@ -3480,6 +4512,7 @@ class MainWindow(QtWidgets.QWidget):
                 first_file = downloaded_versions[0]
                 self.last_version_diagbox = first_file['version']
                 self.diagbox_path = first_file['path']
+                archive_present = True
                 logger.info(f"Installing local file (maintenance mode): {self.last_version_diagbox}, path: {self.diagbox_path}")
             else:
                 QtWidgets.QMessageBox.warning(
@@ -3489,7 +4522,7 @@ class MainWindow(QtWidgets.QWidget):
                 )
                 return
         
-        if not os.path.exists(self.diagbox_path):
+        if not archive_present:
             logger.error(f"Diagbox file not found: {self.diagbox_path}")
             # Get the version being attempted
             version = self.last_version_diagbox if self.last_version_diagbox else "Unknown"
@@ -3499,76 +4532,59 @@ class MainWindow(QtWidgets.QWidget):
             full_path = os.path.join(self.download_folder, f"{version}.7z")
             old_path = os.path.join(self.download_folder, f"Diagbox_Install_{version}.7z")
             all_paths = f"{normalized_path}\n  ou\n{full_path}\n  ou\n{old_path}"
+            text = translator.t('messages.install.file_not_found', version=version, path=all_paths)
+            # Show what the download folder does contain, from the listing used above
+            available = sorted(v['filename'] for v in self.check_downloaded_versions())
+            if available:
+                text += "\n\n" + translator.t('labels.downloaded_versions', versions=", ".join(available))
             QtWidgets.QMessageBox.warning(
                 self, 
                 translator.t('messages.install.title'), 
-                translator.t('messages.install.file_not_found', version=version, path=all_paths)
+                text
             )
             return
         
         # Disable all buttons and combo box
         self.set_buttons_enabled(False)
         
-        # Get install button reference
-        install_button = None
-        for child in self.stack.currentWidget().findChildren(QtWidgets.QPushButton):
-            if child.text() == "Install":
-                install_button = child
-                break
-        
         # Start installation in thread
         self.install_thread = InstallThread(self.diagbox_path)
-        self.install_thread.progress.connect(self.update_install_progress)
-        self.install_thread.file_progress.connect(self.update_install_file)
-        # Connect runtimes signals so UI can reflect runtimes installer state
-        try:
-            self.install_thread.runtimes_started.connect(self._on_runtimes_started_from_installthread)
-            self.install_thread.runtimes_finished.connect(self._on_runtimes_finished_from_installthread)
-            # Connect driver finished signal so we can include it in the final summary
-            try:
-                self.install_thread.driver_finished.connect(self._on_driver_finished_from_installthread)
-            except Exception:
-                logger.debug("Failed to connect driver_finished signal")
-            # Connect defender finished signal so we can include it in the final summary
-            try:
-                self.install_thread.defender_finished.connect(self._on_defender_finished_from_installthread)
-            except Exception:
-                logger.debug("Failed to connect defender_finished signal")
-            logger.info("[INSTALL] Runtimes signals connected successfully")
-        except Exception as e:
-            logger.error(f"[INSTALL] Failed to connect runtimes signals: {e}", exc_info=True)
-        self.install_thread.finished.connect(lambda success, message: self.on_install_finished(success, message, install_button, None))
+        self.install_thread.progress.connect(self.update_install_progress, QtCore.Qt.ConnectionType.QueuedConnection)
+        self.install_thread.file_progress.connect(self.update_install_file, QtCore.Qt.ConnectionType.QueuedConnection)
+        # Runtimes signals let the UI reflect runtimes installer state; driver and
+        # defender results are included in the final summary
+        worker = self.install_thread
+        self._safe_connect(worker.runtimes_started, self._on_runtimes_started_from_installthread, 'runtimes_started')
+        self._safe_connect(worker.runtimes_finished, self._on_runtimes_finished_from_installthread, 'runtimes_finished')
+        self._safe_connect(worker.driver_finished, self._on_driver_finished_from_installthread, 'driver_finished')
+        self._safe_connect(worker.defender_finished, self._on_defender_finished_from_installthread, 'defender_finished')
+        self.install_thread.finished.connect(self._on_install_thread_finished)
         self.install_thread.start()
 
     def clean_diagbox(self):
         """Clean Diagbox installation by removing C:\\APP, C:\\AWRoot, C:\\APPLIC, and C:\\oud folders"""
         logger.info("Clean Diagbox initiated")
-        # Check which folders exist
-        folders_to_delete = []
-        folders = [r"C:\APP", r"C:\AWRoot", r"C:\APPLIC", r"C:\oud"]
-        
-        for folder in folders:
-            if os.path.exists(folder):
-                folders_to_delete.append(folder)
+        # Check which folders exist: they all live in C:\, so list it once
+        try:
+            with os.scandir("C:\\") as it:
+                root_dirs = {entry.name.lower() for entry in it if entry.is_dir()}
+            folders_to_delete = [path for name, path in DIAGBOX_ROOT_FOLDERS if name in root_dirs]
+        except OSError:
+            folders_to_delete = [path for _, path in DIAGBOX_ROOT_FOLDERS if os.path.exists(path)]
         
-        # Check for desktop shortcuts
+        # Check for desktop shortcuts: one directory listing instead of an exists() probe per known name
         shortcuts_to_delete = []
-        public_desktop = r"C:\Users\Public\Desktop"
-        # Known public desktop shortcut filenames (include variants)
-        shortcut_names = [
-            "Diagbox Language Changer.lnk",
-            "Change Diagbox Language.lnk",
-            "Diagbox.lnk",
-            "PSA Interface Checker.lnk",
-            "PSA XS Evolution Interface Checker.lnk",
-            "Terminate Diagbox Process.lnk",
-            "Terminate Diagbox Processes.lnk"
-        ]
-        
-        for shortcut in shortcut_names:
-            shortcut_path = os.path.join(public_desktop, shortcut)
-            if os.path.exists(shortcut_path):
-                shortcuts_to_delete.append(shortcut_path)
+        try:
+            with os.scandir(PUBLIC_DESKTOP) as it:
+                for entry in it:
+                    if entry.name.lower() in DIAGBOX_SHORTCUT_NAMES_LOWER and entry.is_file(follow_symlinks=False):
+                        shortcuts_to_delete.append(entry.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # Listing refused (e.g. access denied): probe the known paths directly
+            logger.debug(f"Could not list {PUBLIC_DESKTOP}: {e}")
+            shortcuts_to_delete = [path for path in DIAGBOX_SHORTCUT_PATHS if os.path.exists(path)]
 
         # Also detect specific VCI driver FileRepository folder and its .ini
         vcomm_folder = r"C:\Windows\System32\DriverStore\FileRepository\vcommusb.inf_amd64_0cb1ee01f7e64ab9"
@@ -3607,25 +4623,15 @@ class MainWindow(QtWidgets.QWidget):
             pass
 
         # Confirm deletion - build sections: Folders, Shortcuts, Driver
-        items_list = []
+        sections = []
         if folders_to_delete:
-            items_list.append("Folders:")
-            items_list.extend([f"- {folder}" for folder in folders_to_delete])
-
+            sections.append("Folders:\n" + "\n".join(f"- {folder}" for folder in folders_to_delete))
         if shortcuts_to_delete:
-            if items_list:
-                items_list.append("")
-            items_list.append("Shortcuts:")
-            items_list.extend([f"- {os.path.basename(s)}" for s in shortcuts_to_delete])
-
+            sections.append("Shortcuts:\n" + "\n".join(f"- {os.path.basename(s)}" for s in shortcuts_to_delete))
         if driver_items:
-            if items_list:
-                items_list.append("")
-            items_list.append("Driver:")
             # Use a human-friendly label for the driver entry
-            items_list.append(f"- PSA XS Evolution (vcommusb.inf)")
-
-        items_text = "\n".join(items_list)
+            sections.append("Driver:\n- PSA XS Evolution (vcommusb.inf)")
+        items_text = "\n\n".join(sections)
         reply = QtWidgets.QMessageBox.question(
             self,
             translator.t('messages.clean.title'),
@@ -3644,11 +4650,11 @@ class MainWindow(QtWidgets.QWidget):
         self.kill_diagbox_processes_silent()
         
         # Initialize footer progress to indeterminate mode
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             # Use indeterminate progress (0, 0) during cleaning
             self.footer_progress.setRange(0, 0)
             self.footer_progress.setValue(0)
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText("Cleaning Diagbox...")
         
         # Start cleaning in thread (pass driver items separately)
@@ -3658,19 +4664,19 @@ class MainWindow(QtWidgets.QWidget):
             driver_items = []
 
         self.clean_thread = CleanThread(folders_to_delete, shortcuts_to_delete, driver_items)
-        self.clean_thread.progress.connect(self.update_clean_progress)
-        self.clean_thread.item_progress.connect(self.update_clean_item)
+        self.clean_thread.progress.connect(self.update_clean_progress, QtCore.Qt.ConnectionType.QueuedConnection)
+        self.clean_thread.item_progress.connect(self.update_clean_item, QtCore.Qt.ConnectionType.QueuedConnection)
         self.clean_thread.finished.connect(self.on_clean_finished)
         self.clean_thread.start()
     
     def update_clean_progress(self, current, total):
         """Update clean progress bar"""
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setValue(current)
     
     def update_clean_item(self, item_name):
         """Update current item being cleaned"""
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText(item_name)
     
     def on_clean_finished(self, success, message, success_count):
@@ -3679,9 +4685,9 @@ class MainWindow(QtWidgets.QWidget):
         self.set_buttons_enabled(True)
         
         # Update footer to show completion
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText("Clean complete")
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             # If progress was indeterminate (maximum == 0), switch to determinate and show complete
             try:
                 if self.footer_progress.maximum() == 0:
@@ -3764,7 +4770,7 @@ class MainWindow(QtWidgets.QWidget):
 
         # Quick check: if .ini already present, consider driver already installed
         try:
-            if os.path.exists(ini_check):
+            if _cached_exists(ini_check):
                 logger.info("VCI .ini already present - driver considered installed")
                 return True, translator.t('messages.vci_driver.already_present')
         except Exception:
@@ -3775,23 +4781,27 @@ class MainWindow(QtWidgets.QWidget):
             proc = subprocess.run(
                 [dpinst_path, '/PATH', dp_path_arg],
                 capture_output=True,
-                text=True,
-                cwd=os.path.dirname(dpinst_path)
+                encoding=SUBPROCESS_ENCODING,
+                errors='replace',
+                cwd=os.path.dirname(dpinst_path),
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
             )
             out = (proc.stdout or '').strip()
             err = (proc.stderr or '').strip()
             rc = proc.returncode
+            # DPInst may have just created the .ini: verify with a fresh stat
+            _forget_exists(ini_check)
             logger.debug(f"DPInst returned code={rc}")
             if out:
-                logger.debug(f"DPInst stdout: {out[:2000]}")
+                logger.debug(f"DPInst stdout: {out[-2000:]}")
             if err:
-                logger.warning(f"DPInst stderr: {err[:2000]}")
+                logger.warning(f"DPInst stderr: {err[-2000:]}")
 
             # Consider 0 as success; 256 indicates success but reboot required
             if rc == 0:
                 # Verify by checking for the .ini file
                 try:
-                    if os.path.exists(ini_check):
+                    if _cached_exists(ini_check):
                         msg = translator.t('messages.vci_driver.success')
                         logger.info("VCI Driver installation verified via .ini presence")
                         return True, msg
@@ -3807,7 +4817,7 @@ class MainWindow(QtWidgets.QWidget):
                 logger.info("DPInst reported reboot required; treating as success requiring reboot")
                 return True, msg
             else:
-                logger.warning(f"DPInst failed with code {rc}: {err[:400]}")
+                logger.warning(f"DPInst failed with code {rc}: {err[-400:]}")
                 return False, translator.t('messages.vci_driver.warning', code=rc) + "\n" + (err or '')
         except Exception as e:
             logger.error(f"DPInst installation exception: {e}", exc_info=True)
@@ -3818,19 +4828,25 @@ class MainWindow(QtWidgets.QWidget):
         logger.info("Launch Diagbox initiated")
         diagbox_exe = r"C:\AWRoot\bin\launcher\Diagbox.exe"
         
-        # Check if Diagbox.exe exists
-        if not os.path.exists(diagbox_exe):
+        try:
+            # Launch Diagbox.exe detached: no inherited handles or std streams, own process group.
+            # A missing executable surfaces as FileNotFoundError, no separate exists() probe
+            subprocess.Popen(
+                [diagbox_exe],
+                cwd=r"C:\AWRoot\bin\launcher",
+                close_fds=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=(subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP) if sys.platform == 'win32' else 0
+            )
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"Diagbox.exe not found: {diagbox_exe}")
             QtWidgets.QMessageBox.warning(
                 self,
                 translator.t('messages.launch.title'),
                 translator.t('messages.launch.not_found', path=diagbox_exe)
             )
-            return
-        
-        try:
-            # Launch Diagbox.exe
-            subprocess.Popen([diagbox_exe], cwd=r"C:\AWRoot\bin\launcher")
         except Exception as e:
             QtWidgets.QMessageBox.critical(
                 self,
@@ -3840,91 +4856,23 @@ class MainWindow(QtWidgets.QWidget):
 
     def kill_diagbox_processes_silent(self):
         """Kill all Diagbox related processes silently (no message)"""
-        # List of Diagbox process names to kill
-        process_names = [
-            "AWFInterpreter_vc80.exe",
-            "LctPOLUX.exe",
-            "AWRSrv.exe",
-            "MCComm.exe",
-            "fbguard.exe",
-            "fbserver.exe",
-            "httpd_ddc.exe",
-            "diagnostic.exe",
-            "awrsrv.exe",
-            "awacscmd.exe",
-            "awrcmd.exe",
-            "AWACSserver.exe",
-            "psaagent.exe",
-            "psaSingleSignOnDaemon.exe",
-            "psalance.exe",
-            "mccomm.exe",
-            "sim.exe",
-            "firefoxportable.exe",
-            "Ftspssrv.exe",
-            "j9w.exe",
-            "eclipse.exe",
-            "Java.exe",
-            "Jusched.exe",
-            "Pg_ctl.exe",
-            "Postgres.exe",
-            "Sed.exe",
-            "LCTPolux.exe",
-            "DccFsmRunner.exe",
-            "DdcECUReader.exe",
-            "WSTransformer.exe",
-            "partialtrace.exe",
-            "psainterfaceservice.exe",
-            "FirefoxPortable.exe",
-            "psaAgent.exe",
-            "Ground.exe",
-            "instsvc.exe",
-            "instreg.exe",
-            "Psarefreshredwire.exe",
-            "PSA-AUTH_Killer.exe",
-            "Diagbox.exe"
-        ]
-        
         try:
-            # Iterate through all running processes
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    # Check if process name matches any Diagbox process (case-insensitive)
-                    proc_name = proc.info['name']
-                    if any(proc_name.lower() == pname.lower() for pname in process_names):
-                        proc.kill()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            # Iterate through all running processes (names come back lowercased)
+            for pid, name in iter_process_names():
+                if name in DIAGBOX_PROCESS_NAMES_LOWER:
+                    terminate_pid(pid)
         except:
             pass  # Silent failure
 
     def kill_diagbox(self):
         """Kill all Diagbox related processes with user feedback"""
-        killed_count = 0
-        
-        # Get list before killing to count
-        process_names = [
-            "AWFInterpreter_vc80.exe", "LctPOLUX.exe", "AWRSrv.exe", "MCComm.exe",
-            "fbguard.exe", "fbserver.exe", "httpd_ddc.exe", "diagnostic.exe",
-            "awrsrv.exe", "awacscmd.exe", "awrcmd.exe", "AWACSserver.exe",
-            "psaagent.exe", "psaSingleSignOnDaemon.exe", "psalance.exe", "mccomm.exe",
-            "sim.exe", "firefoxportable.exe", "Ftspssrv.exe", "j9w.exe",
-            "eclipse.exe", "Java.exe", "Jusched.exe", "Pg_ctl.exe",
-            "Postgres.exe", "Sed.exe", "LCTPolux.exe", "DccFsmRunner.exe",
-            "DdcECUReader.exe", "WSTransformer.exe", "partialtrace.exe",
-            "psainterfaceservice.exe", "FirefoxPortable.exe", "psaAgent.exe",
-            "Ground.exe", "instsvc.exe", "instreg.exe", "Psarefreshredwire.exe",
-            "PSA-AUTH_Killer.exe", "Diagbox.exe"
-        ]
-        
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    proc_name = proc.info['name']
-                    if any(proc_name.lower() == pname.lower() for pname in process_names):
-                        proc.kill()
-                        killed_count += 1
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            # Collect targets in one scan, then terminate them concurrently
+            targets = [pid for pid, name in iter_process_names() if name in DIAGBOX_PROCESS_NAMES_LOWER]
+            killed_count = 0
+            if targets:
+                with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+                    killed_count = sum(executor.map(terminate_pid, targets))
             
             if killed_count > 0:
                 QtWidgets.QMessageBox.information(
@@ -3956,6 +4904,7 @@ class MainWindow(QtWidgets.QWidget):
         new_lang = self.app_language_combo.currentData()
         if new_lang and new_lang != translator.language:
             translator.set_language(new_lang)
+            self._retranslate_cache()
             # Show restart dialog
             reply = QtWidgets.QMessageBox.question(
                 self,
@@ -4103,18 +5052,20 @@ class MainWindow(QtWidgets.QWidget):
             if latest:
                 self.last_version_diagbox = latest
                 logger.info(f"Last Diagbox version: {self.last_version_diagbox}")
-                # Try three possible file formats
+                # Try three possible file formats against one listing of the download folder
                 normalized = self._sanitize_version_for_filename(self.last_version_diagbox)
-                normalized_format = os.path.join(self.download_folder, f"{normalized}.7z")
-                full_format = os.path.join(self.download_folder, f"{self.last_version_diagbox}.7z")
-                old_format = os.path.join(self.download_folder, f"Diagbox_Install_{self.last_version_diagbox}.7z")
-                
-                if os.path.exists(normalized_format):
-                    self.diagbox_path = normalized_format
-                elif os.path.exists(full_format):
-                    self.diagbox_path = full_format
+                candidates = (f"{normalized}.7z", f"{self.last_version_diagbox}.7z")
+                try:
+                    with os.scandir(self.download_folder) as it:
+                        present = {os.path.normcase(entry.name) for entry in it}
+                except OSError:
+                    present = set()
+                for name in candidates:
+                    if os.path.normcase(name) in present:
+                        break
                 else:
-                    self.diagbox_path = old_format
+                    name = f"Diagbox_Install_{self.last_version_diagbox}.7z"
+                self.diagbox_path = os.path.join(self.download_folder, name)
             else:
                 logger.warning("No version options available")
         except Exception as e:
@@ -4128,19 +5079,14 @@ class MainWindow(QtWidgets.QWidget):
                 return
 
             logger.info("[STEP 4] -- Checking for app updates...")
-            response = requests.get(URL_LAST_VERSION_PSADIAG, timeout=5)
-            response.raise_for_status()
-            data = response.json()
+            prefetched = getattr(self, 'remote_metadata', {}).pop('psadiag', None)
+            data = resolve_remote_json(prefetched, URL_LAST_VERSION_PSADIAG, TTL_LAST_VERSION_PSADIAG, timeout=5)
             latest_version = data.get('version', '')
             logger.info(f"Latest app version: {latest_version}, Current: {APP_VERSION}")
             
             if latest_version and latest_version != APP_VERSION:
-                # Compare versions (simple string comparison, assumes format like "2.0.0.0")
-                current_parts = [int(x) for x in APP_VERSION.split('.')]
-                latest_parts = [int(x) for x in latest_version.split('.')]
-                
-                # Check if latest is newer
-                if latest_parts > current_parts:
+                # Check if latest is newer (numeric tuple comparison, format like "2.0.0.0")
+                if _parse_version(latest_version) > _parse_version(APP_VERSION):
                     logger.info("New version available, showing update dialog")
                     reply = QtWidgets.QMessageBox.question(
                         self,
@@ -4167,11 +5113,9 @@ class MainWindow(QtWidgets.QWidget):
 
     def perform_self_update(self, latest_version):
         """Download latest release executable to C:\\INSTALL\\Update and stage it for startup handoff."""
+        update_title = translator.t('messages.update.title')
         try:
-            # Create a session with retry strategy for robust downloads
-            from requests.adapters import HTTPAdapter
-            from urllib3.util.retry import Retry
-            
+            # Dedicated session with a retry strategy for the large asset download
             # Use proper headers to avoid GitHub blocking
             headers = {
                 'User-Agent': 'PSA-DIAG/2.3.1.0'
@@ -4194,84 +5138,100 @@ class MainWindow(QtWidgets.QWidget):
             
             api_url = "https://api.github.com/repos/RetroGameSets/PSA-DIAG/releases/latest"
             logger.debug(f"Querying GitHub API for latest release")
-            r = session.get(api_url, timeout=15)
+            # The API call goes through the shared keep-alive session, which already
+            # holds a connection to api.github.com from the changelog fetch
+            r = get_http_session().get(api_url, timeout=15, headers=GITHUB_API_HEADERS)
             r.raise_for_status()
             release = r.json()
 
             # Find a downloadable .exe asset
-            exe_asset = None
-            for asset in release.get('assets', []):
-                name = asset.get('name', '')
-                if name.lower().endswith('.exe'):
-                    exe_asset = asset
-                    break
-
-            if not exe_asset:
-                QtWidgets.QMessageBox.warning(self, translator.t('messages.update.title'), translator.t('messages.update.no_asset'))
-                return
-
-            download_url = exe_asset.get('browser_download_url')
+            exe_asset = next((a for a in release.get('assets', []) if (a.get('name') or '').lower().endswith('.exe')), None)
+            download_url = exe_asset.get('browser_download_url') if exe_asset else None
             if not download_url:
-                QtWidgets.QMessageBox.warning(self, translator.t('messages.update.title'), translator.t('messages.update.no_asset'))
+                QtWidgets.QMessageBox.warning(self, update_title, translator.t('messages.update.no_asset'))
                 return
 
-            updates_dir = UPDATE_DIR
-            updates_dir.mkdir(parents=True, exist_ok=True)
+            UPDATE_DIR.mkdir(parents=True, exist_ok=True)
             target_name = f"PSA_DIAG_update_{latest_version}.exe"
-            download_path = str(updates_dir / target_name)
+            download_path = os.path.join(UPDATE_DIR_STR, target_name)
+            part_path = download_path + '.part'
+
+            # GitHub publishes "sha256:<hex>" digests for release assets
+            digest = str(exe_asset.get('digest') or '')
+            expected_sha256 = digest[7:].lower() if digest.lower().startswith('sha256:') else None
+
+            # An identical executable from an earlier attempt can be staged as-is
+            already_downloaded = False
+            if expected_sha256 and os.path.isfile(download_path):
+                try:
+                    already_downloaded = _file_sha256(download_path) == expected_sha256
+                except OSError as e:
+                    logger.debug(f"Could not hash existing update file: {e}")
 
             # Keep only one pending update executable.
             try:
-                for old_exe in updates_dir.glob('*.exe'):
-                    try:
-                        old_exe.unlink()
-                    except Exception:
-                        pass
+                keep = os.path.normcase(target_name) if already_downloaded else None
+                with os.scandir(UPDATE_DIR_STR) as it:
+                    for entry in it:
+                        name = os.path.normcase(entry.name)
+                        if not name.endswith('.exe') or name == keep:
+                            continue
+                        try:
+                            os.unlink(entry.path)
+                        except Exception:
+                            pass
                 UPDATE_READY_FILE.unlink(missing_ok=True)
             except Exception as e:
                 logger.warning(f"Failed to clear previous pending updates: {e}")
 
-            # Download with progress and robust streaming
-            logger.debug(f"Downloading update asset: -> {download_path}")
-            logger.info(f"Download size: {exe_asset.get('size', 'unknown')} bytes")
-            
-            # Use increased timeout and smaller chunks for stability
-            downloaded_bytes = 0
-            expected_size = int(exe_asset.get('size') or 0)
-            # Headers specific to the file download (not for API calls)
-            download_headers = {
-                'User-Agent': 'PSA-DIAG/2.3.1.0',
-                'Accept': 'application/octet-stream'
-            }
+            if already_downloaded:
+                logger.info(f"Update already downloaded and verified: {download_path}")
+            else:
+                # Stream into a .part file next to the target, then swap it into place
+                logger.debug(f"Downloading update asset: -> {download_path}")
+                logger.info(f"Download size: {exe_asset.get('size', 'unknown')} bytes")
+
+                downloaded_bytes = 0
+                expected_size = int(exe_asset.get('size') or 0)
+                sha256 = hashlib.sha256()
+                # Headers specific to the file download (not for API calls)
+                download_headers = {
+                    'User-Agent': 'PSA-DIAG/2.3.1.0',
+                    'Accept': 'application/octet-stream'
+                }
 
-            try:
-                with session.get(download_url, stream=True, timeout=120, headers=download_headers, verify=True) as resp:
-                    resp.raise_for_status()
-                    total_size = int(resp.headers.get('content-length', 0))
-
-                    with open(download_path, 'wb') as f:
-                        # Download in smaller chunks with reasonable buffer size
-                        for chunk in resp.iter_content(chunk_size=32768):  # 32KB chunks
-                            if chunk:
-                                f.write(chunk)
-                                downloaded_bytes += len(chunk)
-                                if total_size > 0:
-                                    percent = (downloaded_bytes / total_size) * 100
-                                    logger.debug(f"Download progress: {percent:.1f}% ({downloaded_bytes}/{total_size} bytes)")
-
-                # Integrity checks: reject partial/corrupted downloads
-                file_size = os.path.getsize(download_path)
-                if total_size > 0 and file_size != total_size:
-                    raise IOError(f"Downloaded file size mismatch with Content-Length ({file_size} != {total_size})")
-                if expected_size > 0 and file_size != expected_size:
-                    raise IOError(f"Downloaded file size mismatch with GitHub asset size ({file_size} != {expected_size})")
-            except Exception:
                 try:
-                    if os.path.exists(download_path):
-                        os.remove(download_path)
+                    with session.get(download_url, stream=True, timeout=120, headers=download_headers, verify=True) as resp:
+                        resp.raise_for_status()
+                        total_size = int(resp.headers.get('content-length', 0))
+
+                        with open(part_path, 'wb') as f:
+                            # 1 MiB chunks: few Python-level writes, hashed while streaming
+                            for chunk in resp.iter_content(chunk_size=1 << 20):
+                                if chunk:
+                                    f.write(chunk)
+                                    sha256.update(chunk)
+                                    downloaded_bytes += len(chunk)
+                                    if total_size > 0:
+                                        logger.debug("Download progress: %.1f%% (%d/%d bytes)",
+                                                     downloaded_bytes * 100 / total_size, downloaded_bytes, total_size)
+                            f.flush()
+                            os.fsync(f.fileno())
+
+                    # Integrity checks: reject partial/corrupted downloads
+                    if total_size > 0 and downloaded_bytes != total_size:
+                        raise IOError(f"Downloaded file size mismatch with Content-Length ({downloaded_bytes} != {total_size})")
+                    if expected_size > 0 and downloaded_bytes != expected_size:
+                        raise IOError(f"Downloaded file size mismatch with GitHub asset size ({downloaded_bytes} != {expected_size})")
+                    if expected_sha256 and sha256.hexdigest() != expected_sha256:
+                        raise IOError(f"Downloaded file SHA-256 mismatch ({sha256.hexdigest()} != {expected_sha256})")
+                    os.replace(part_path, download_path)
                 except Exception:
-                    pass
-                raise
+                    try:
+                        os.remove(part_path)
+                    except OSError:
+                        pass
+                    raise
             
             if os.path.exists(download_path):
                 file_size = os.path.getsize(download_path)
@@ -4293,14 +5253,14 @@ class MainWindow(QtWidgets.QWidget):
             creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
             QtWidgets.QMessageBox.information(
                 self,
-                translator.t('messages.update.title'),
+                update_title,
                 translator.t('messages.update.closing_app')
             )
             try:
                 subprocess.Popen([str(current_exe)], creationflags=creationflags)
             except Exception as e:
                 logger.error(f"Failed to restart application for update apply: {e}")
-                QtWidgets.QMessageBox.warning(self, translator.t('messages.update.title'), translator.t('messages.update.launch_failed', error=str(e)))
+                QtWidgets.QMessageBox.warning(self, update_title, translator.t('messages.update.launch_failed', error=str(e)))
                 return
 
             self._allow_close = True
@@ -4308,7 +5268,7 @@ class MainWindow(QtWidgets.QWidget):
 
         except Exception as e:
             logger.error(f"Self-update failed: {e}", exc_info=True)
-            QtWidgets.QMessageBox.warning(self, translator.t('messages.update.title'), translator.t('messages.update.failed', error=str(e)))
+            QtWidgets.QMessageBox.warning(self, update_title, translator.t('messages.update.failed', error=str(e)))
 
     def download_diagbox(self):
         logger.info("Download Diagbox button clicked")
@@ -4390,7 +5350,7 @@ class MainWindow(QtWidgets.QWidget):
         if selected_mode == "direct":
             try:
                 # Follow redirects to get actual file size
-                head = requests.head(active_url, allow_redirects=True, timeout=10)
+                head = get_http_session().head(active_url, allow_redirects=True, timeout=10)
                 total_size = int(head.headers.get('content-length', 0))
                 logger.info(f"File size from HEAD request: {total_size / (1024*1024):.2f} MB")
             except Exception as e:
@@ -4437,11 +5397,12 @@ class MainWindow(QtWidgets.QWidget):
             logger.info(f"Starting direct download from: {active_url}")
             self.download_thread = DownloadThread(active_url, file_path, self.last_version_diagbox, total_size)
         
-        self.download_thread.progress.connect(self.update_progress)
+        self.download_thread.progress.connect(self.update_progress, QtCore.Qt.ConnectionType.QueuedConnection)
         self.download_thread.finished.connect(self.on_download_finished)
         self.download_thread.start()
 
     def setup_ui(self):
+        t = translator.t
         # Main layout
         main_layout = QtWidgets.QHBoxLayout(self)
         main_layout.setContentsMargins(10,10,10,10)
@@ -4455,7 +5416,7 @@ class MainWindow(QtWidgets.QWidget):
         vbox.setSpacing(14)
 
         # Title in sidebar
-        title_sidebar = QtWidgets.QLabel(translator.t('app.title'))
+        title_sidebar = QtWidgets.QLabel(t('app.title'))
         title_sidebar.setObjectName("titleLabel")
         title_sidebar.setWordWrap(True)
         title_sidebar.setStyleSheet("font-size: 13px;")
@@ -4516,7 +5477,7 @@ class MainWindow(QtWidgets.QWidget):
         vbox.addWidget(donate_btn)
 
         # Display app version under logo in the sidebar
-        self.sidebar_version_label = QtWidgets.QLabel(translator.t('labels.version', version=APP_VERSION))
+        self.sidebar_version_label = QtWidgets.QLabel(t('labels.version', version=APP_VERSION))
         self.sidebar_version_label.setObjectName("sidebarVersion")
         self.sidebar_version_label.setStyleSheet("font-size:11px; color: #b0b0b0;")
         self.sidebar_version_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -4532,8 +5493,8 @@ class MainWindow(QtWidgets.QWidget):
         # Custom title row (min/close only)
         title_row = QtWidgets.QHBoxLayout()
         title_row.addStretch()
-        btn_min = QtWidgets.QPushButton(translator.t('buttons.minimize'))
-        btn_close = QtWidgets.QPushButton(translator.t('buttons.close'))
+        btn_min = QtWidgets.QPushButton(t('buttons.minimize'))
+        btn_close = QtWidgets.QPushButton(t('buttons.close'))
         btn_min.setFixedSize(34,28)
         btn_close.setFixedSize(34,28)
         btn_min.setObjectName("titleButton")
@@ -4561,7 +5522,7 @@ class MainWindow(QtWidgets.QWidget):
         footer_layout.setSpacing(4)
         
         # Progress label
-        self.footer_label = QtWidgets.QLabel(translator.t('labels.ready'))
+        self.footer_label = QtWidgets.QLabel(t('labels.ready'))
         self.footer_label.setStyleSheet("color: #b0b0b0; font-size: 11px;")
         footer_layout.addWidget(self.footer_label)
         
@@ -4598,7 +5559,7 @@ class MainWindow(QtWidgets.QWidget):
         log_sidebar_layout.addWidget(self.log_widget)
         
         # Open logs button at bottom of log sidebar
-        self.open_log_btn = QtWidgets.QPushButton(translator.t('buttons.open_log'))
+        self.open_log_btn = QtWidgets.QPushButton(t('buttons.open_log'))
         self.open_log_btn.setFixedHeight(32)
         self.open_log_btn.setStyleSheet("font-size: 10px;")
         self.open_log_btn.clicked.connect(self.open_logs)
@@ -4622,7 +5583,6 @@ class MainWindow(QtWidgets.QWidget):
                             continue
                         # Remove timestamp (format: "2025-12-07 14:37:25,655 - ")
                         # Match timestamp pattern and remove it
-                        import re
                         line_without_timestamp = re.sub(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} - ', '', line)
                         filtered_lines.append(line_without_timestamp)
                     
@@ -4735,6 +5695,8 @@ class MainWindow(QtWidgets.QWidget):
             logger.info(f"Forcing process exit after tray quit. Active threads={active_threads}")
         except Exception:
             logger.info("Forcing process exit after tray quit")
+        # os._exit skips atexit: drain queued log records to the file first
+        _log_listener.stop()
         os._exit(0)
 
     def check_system(self):
@@ -4846,27 +5808,11 @@ class MainWindow(QtWidgets.QWidget):
     def _run_defender_rules_creation(self):
         """Run PowerShell script to add Defender exclusions (background thread)."""
         try:
-            defender_paths = [
-                r"C:\AWRoot",
-                r"C:\INSTALL",
-                r"C:\Program Files (x86)\PSA VCI",
-                r"C:\Program Files\PSA VCI",
-                r"C:\Windows\VCX.dll",
-            ]
-            # Build PowerShell script to add any missing exclusions and return JSON
-            ps_paths = ",".join(["'{}'".format(p) for p in defender_paths])
-            ps_script = (
-                "try { $existing=(Get-MpPreference).ExclusionPath; $added=@(); $failed=@();"
-                + "foreach($p in @(" + ps_paths + ")) { if($existing -notcontains $p) { try { Add-MpPreference -ExclusionPath $p; $added += $p } catch { $failed += $p } } }"
-                + "$res = @{added=$added; failed=$failed}; $res | ConvertTo-Json -Compress } catch { Write-Error $_; exit 1 }"
-            )
-            cmd = ["powershell.exe", "-NoProfile", "-NonInteractive", "-Command", ps_script]
             logger.info("Creating Defender exclusions via PowerShell (manual)")
-            proc = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
+            proc = subprocess.run(DEFENDER_EXCLUSION_COMMAND, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
             if proc.returncode == 0:
                 out = (proc.stdout or '').strip()
                 try:
-                    import json
                     j = json.loads(out) if out else {"added":[], "failed":[]}
                     added = j.get('added') or []
                     failed = j.get('failed') or []
@@ -4880,6 +5826,7 @@ class MainWindow(QtWidgets.QWidget):
                         else:
                             msg = translator.t('messages.defender.no_changes')
                         logger.info(msg)
+                        remember_defender_exclusions()
                         self.manual_defender_finished.emit(True, msg)
                 except Exception as e:
                     logger.error(f"Failed to parse Defender PowerShell output: {e}")
@@ -4966,10 +5913,13 @@ class MainWindow(QtWidgets.QWidget):
         except Exception:
             return [0]
 
-    def _sanitize_version_for_filename(self, version_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _sanitize_version_for_filename(version_str: str) -> str:
         """Return a safe filename base for a given version string.
         Prefer the first numeric sequence (e.g. '09.186') if present; otherwise
         fall back to a sanitized version of the original string.
+        Memoized: the same handful of version strings are sanitized on every scan.
         """
         try:
             m = re.search(r"(\d+(?:\.\d+)*)", str(version_str))
@@ -5138,12 +6088,13 @@ class MainWindow(QtWidgets.QWidget):
         return w
 
     def page_install(self):
+        t = translator.t
         w = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(w)
         layout.setSpacing(10)
 
         # Page title
-        page_title = QtWidgets.QLabel(translator.t('titles.diagbox_native_install'))
+        page_title = QtWidgets.QLabel(t('titles.diagbox_native_install'))
         page_title.setObjectName("pageTitle")
         page_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #5cb85c; padding: 10px;")
         page_title.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -5165,7 +6116,7 @@ class MainWindow(QtWidgets.QWidget):
         downloaded_versions = self.check_downloaded_versions()
         if downloaded_versions:
             downloaded_text = ", ".join([f"{v['version']} ({v['size_mb']:.1f} MB)" for v in downloaded_versions])
-            self.header_downloaded = QtWidgets.QLabel(translator.t('labels.downloaded_versions', versions=downloaded_text))
+            self.header_downloaded = QtWidgets.QLabel(t('labels.downloaded_versions', versions=downloaded_text))
             self.header_downloaded.setObjectName("sectionHeader")
             self.header_downloaded.setStyleSheet("color: #5cb85c;")
             layout.addWidget(self.header_downloaded)
@@ -5178,11 +6129,11 @@ class MainWindow(QtWidgets.QWidget):
 
         # Version selection dropdown (or maintenance message if versions unavailable)
         version_layout = QtWidgets.QHBoxLayout()
-        version_label = QtWidgets.QLabel(translator.t('labels.select_version'))
+        version_label = QtWidgets.QLabel(t('labels.select_version'))
 
         if not getattr(self, 'version_options', None):
             # Show maintenance message instead of combo when no versions available
-            maint_msg = translator.t('messages.download.maintenance')
+            maint_msg = t('messages.download.maintenance')
             self.version_combo = None
             self.version_maintenance = QtWidgets.QLabel(maint_msg)
             self.version_maintenance.setWordWrap(True)
@@ -5205,11 +6156,11 @@ class MainWindow(QtWidgets.QWidget):
 
         # Download mode selection (Direct/Torrent) for Diagbox versions
         mode_layout = QtWidgets.QHBoxLayout()
-        mode_label = QtWidgets.QLabel(translator.t('labels.download_mode'))
+        mode_label = QtWidgets.QLabel(t('labels.download_mode'))
         self.diagbox_mode_label = mode_label
         self.diagbox_mode_combo = QtWidgets.QComboBox()
-        self.diagbox_mode_combo.addItem(translator.t('labels.download_direct'), "direct")
-        self.diagbox_mode_combo.addItem(translator.t('labels.download_torrent'), "torrent")
+        self.diagbox_mode_combo.addItem(t('labels.download_direct'), "direct")
+        self.diagbox_mode_combo.addItem(t('labels.download_torrent'), "torrent")
         self.diagbox_mode_combo.setMinimumWidth(120)
         self.diagbox_mode_combo.setVisible(False)
         mode_label.setVisible(False)
@@ -5228,7 +6179,7 @@ class MainWindow(QtWidgets.QWidget):
 
         # Toggle auto install
         h = QtWidgets.QHBoxLayout()
-        lbl = QtWidgets.QLabel(translator.t('labels.auto_install'))
+        lbl = QtWidgets.QLabel(t('labels.auto_install'))
         toggle = QtWidgets.QCheckBox()
         self.auto_install = toggle
         h.addWidget(lbl)
@@ -5238,7 +6189,7 @@ class MainWindow(QtWidgets.QWidget):
 
         # Language selection (will be hidden if no Diagbox installed)
         self.diagbox_lang_layout = QtWidgets.QHBoxLayout()
-        lang_label = QtWidgets.QLabel(translator.t('labels.diagbox_language'))
+        lang_label = QtWidgets.QLabel(t('labels.diagbox_language'))
         self.language_combo = QtWidgets.QComboBox()
         self.diagbox_lang_label = lang_label
 
@@ -5258,7 +6209,7 @@ class MainWindow(QtWidgets.QWidget):
         # fallback to the code string itself.
         languages = []
         for code in default_codes:
-            name = translator.t(f'languages.{code}')
+            name = t(f'languages.{code}')
             # If translator returns the key back (missing), fallback to code
             if name == f'languages.{code}':
                 name = code
@@ -5266,7 +6217,7 @@ class MainWindow(QtWidgets.QWidget):
 
         # If current language exists and is not in defaults, insert it first
         if current_lang and current_lang not in [c for (_, c) in languages]:
-            name = translator.t(f'languages.{current_lang}')
+            name = t(f'languages.{current_lang}')
             if name == f'languages.{current_lang}':
                 name = current_lang
             languages.insert(0, (name, current_lang))
@@ -5296,12 +6247,12 @@ class MainWindow(QtWidgets.QWidget):
         grid = QtWidgets.QGridLayout()
         grid.setSpacing(12)
         btns = [
-            (translator.t('buttons.download'), "download"),
-            (translator.t('buttons.install'), "install"),
-            (translator.t('buttons.clean'), "clean"),
-            (translator.t('buttons.install_vci'), "vci"),
-            (translator.t('buttons.launch'), "launch"),
-            (translator.t('buttons.kill_process'), "kill"),
+            (t('buttons.download'), "download"),
+            (t('buttons.install'), "install"),
+            (t('buttons.clean'), "clean"),
+            (t('buttons.install_vci'), "vci"),
+            (t('buttons.launch'), "launch"),
+            (t('buttons.kill_process'), "kill"),
         ]
         for i, (txt, action) in enumerate(btns):
             b = QtWidgets.QPushButton(txt)
@@ -5331,16 +6282,16 @@ class MainWindow(QtWidgets.QWidget):
             if getattr(self, '_disable_actions_due_to_maintenance', False):
                 if hasattr(self, 'download_button') and self.download_button is not None:
                     self.download_button.setEnabled(False)
-                    self.download_button.setToolTip(translator.t('messages.download.maintenance_tooltip'))
+                    self.download_button.setToolTip(t('messages.download.maintenance_tooltip'))
                 # Check if local files exist - if yes, allow install
                 downloaded_versions = self.check_downloaded_versions()
-                if hasattr(self, 'install_button') and self.install_button is not None:
+                if self.install_button is not None:
                     if downloaded_versions:
                         self.install_button.setEnabled(True)
-                        self.install_button.setToolTip(translator.t('messages.install.local_file_available'))
+                        self.install_button.setToolTip(t('messages.install.local_file_available'))
                     else:
                         self.install_button.setEnabled(False)
-                        self.install_button.setToolTip(translator.t('messages.download.maintenance_tooltip'))
+                        self.install_button.setToolTip(t('messages.download.maintenance_tooltip'))
                 # Also disable banner download action
                 try:
                     self.install_banner_download.setEnabled(False)
@@ -5352,7 +6303,7 @@ class MainWindow(QtWidgets.QWidget):
         # Pause and Cancel buttons (hidden by default)
         buttons_row = QtWidgets.QHBoxLayout()
         
-        self.pause_button = QtWidgets.QPushButton(translator.t('buttons.pause'))
+        self.pause_button = QtWidgets.QPushButton(t('buttons.pause'))
         self.pause_button.setMinimumHeight(44)
         self.pause_button.setObjectName("actionButton")
         self.pause_button.setStyleSheet("background-color: #f0ad4e; color: white;")
@@ -5360,7 +6311,7 @@ class MainWindow(QtWidgets.QWidget):
         self.pause_button.setVisible(False)
         buttons_row.addWidget(self.pause_button)
         
-        self.cancel_button = QtWidgets.QPushButton(translator.t('buttons.cancel'))
+        self.cancel_button = QtWidgets.QPushButton(t('buttons.cancel'))
         self.cancel_button.setMinimumHeight(44)
         self.cancel_button.setObjectName("actionButton")
         self.cancel_button.setStyleSheet("background-color: #d9534f; color: white;")
@@ -5376,10 +6327,10 @@ class MainWindow(QtWidgets.QWidget):
         # Disable install button if a Diagbox version is already installed
         try:
             installed_version = self.check_installed_version()
-            if installed_version and hasattr(self, 'install_button'):
+            if installed_version and self.install_button is not None:
                 self.install_button.setEnabled(False)
-                self.install_button.setToolTip(translator.t('messages.install.must_clean_tooltip', installed=installed_version))
-            elif hasattr(self, 'install_button'):
+                self.install_button.setToolTip(t('messages.install.must_clean_tooltip', installed=installed_version))
+            elif self.install_button is not None:
                 self.install_button.setEnabled(True)
                 self.install_button.setToolTip("")
         except Exception:
@@ -5388,19 +6339,20 @@ class MainWindow(QtWidgets.QWidget):
         return w
 
     def page_vhd(self):
+        t = translator.t
         w = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(w)
         layout.setSpacing(12)
 
         # Page title
-        page_title = QtWidgets.QLabel(translator.t('titles.diagbox_vhdx_install'))
+        page_title = QtWidgets.QLabel(t('titles.diagbox_vhdx_install'))
         page_title.setObjectName("pageTitle")
         page_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #5cb85c; padding: 10px;")
         page_title.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(page_title)
 
         # Header - Download Size (will be updated dynamically)
-        self.vhdx_size_header = QtWidgets.QLabel(translator.t('vhd.labels.download_size'))
+        self.vhdx_size_header = QtWidgets.QLabel(t('vhd.labels.download_size'))
         self.vhdx_size_header.setObjectName("sectionHeader")
         self.vhdx_size_header.setWordWrap(True)
         layout.addWidget(self.vhdx_size_header)
@@ -5413,12 +6365,12 @@ class MainWindow(QtWidgets.QWidget):
 
         # Download server selection
         server_layout = QtWidgets.QHBoxLayout()
-        server_label = QtWidgets.QLabel(translator.t('vhd.labels.download_server'))
+        server_label = QtWidgets.QLabel(t('vhd.labels.download_server'))
         server_label.setStyleSheet("font-size: 12px;")
         self.vhdx_server_combo = QtWidgets.QComboBox()
         self.vhdx_server_combo.setMinimumWidth(200)
-        self.vhdx_server_combo.addItem(translator.t('vhd.servers.server2'), userData="torrent")
-        self.vhdx_server_combo.addItem(translator.t('vhd.servers.server1'), userData="direct")
+        self.vhdx_server_combo.addItem(t('vhd.servers.server2'), userData="torrent")
+        self.vhdx_server_combo.addItem(t('vhd.servers.server1'), userData="direct")
         server_layout.addWidget(server_label)
         server_layout.addWidget(self.vhdx_server_combo)
         server_layout.addStretch()
@@ -5426,7 +6378,7 @@ class MainWindow(QtWidgets.QWidget):
 
         # Destination disk selection
         disk_layout = QtWidgets.QHBoxLayout()
-        disk_label = QtWidgets.QLabel(translator.t('vhd.labels.destination_disk'))
+        disk_label = QtWidgets.QLabel(t('vhd.labels.destination_disk'))
         disk_label.setStyleSheet("font-size: 12px;")
         self.vhdx_disk_combo = QtWidgets.QComboBox()
         self.vhdx_disk_combo.setMinimumWidth(150)
@@ -5441,7 +6393,7 @@ class MainWindow(QtWidgets.QWidget):
 
         # Auto installation toggle
         auto_install_layout = QtWidgets.QHBoxLayout()
-        auto_install_label = QtWidgets.QLabel(translator.t('labels.auto_install'))
+        auto_install_label = QtWidgets.QLabel(t('labels.auto_install'))
         auto_install_label.setStyleSheet("font-size: 12px;")
         self.vhdx_auto_install_toggle = QtWidgets.QCheckBox()
         self.vhdx_auto_install_toggle.setChecked(False)
@@ -5453,13 +6405,13 @@ class MainWindow(QtWidgets.QWidget):
         # Action buttons - Télécharger and Installer
         btn_layout = QtWidgets.QHBoxLayout()
         
-        self.vhdx_download_btn = QtWidgets.QPushButton(translator.t('buttons.download'))
+        self.vhdx_download_btn = QtWidgets.QPushButton(t('buttons.download'))
         self.vhdx_download_btn.setMinimumHeight(44)
         self.vhdx_download_btn.setObjectName("actionButton")
         self.vhdx_download_btn.setMinimumWidth(200)
         self.vhdx_download_btn.clicked.connect(self.download_vhdx)
         
-        self.vhdx_install_btn = QtWidgets.QPushButton(translator.t('buttons.install'))
+        self.vhdx_install_btn = QtWidgets.QPushButton(t('buttons.install'))
         self.vhdx_install_btn.setMinimumHeight(44)
         self.vhdx_install_btn.setObjectName("actionButton")
         self.vhdx_install_btn.setMinimumWidth(200)
@@ -5472,7 +6424,7 @@ class MainWindow(QtWidgets.QWidget):
         # Pause and Cancel buttons for VHD (hidden by default)
         vhd_buttons_row = QtWidgets.QHBoxLayout()
         
-        self.vhd_pause_button = QtWidgets.QPushButton(translator.t('buttons.pause'))
+        self.vhd_pause_button = QtWidgets.QPushButton(t('buttons.pause'))
         self.vhd_pause_button.setMinimumHeight(44)
         self.vhd_pause_button.setObjectName("actionButton")
         self.vhd_pause_button.setStyleSheet("background-color: #f0ad4e; color: white;")
@@ -5480,7 +6432,7 @@ class MainWindow(QtWidgets.QWidget):
         self.vhd_pause_button.setVisible(False)
         vhd_buttons_row.addWidget(self.vhd_pause_button)
         
-        self.vhd_cancel_button = QtWidgets.QPushButton(translator.t('buttons.cancel'))
+        self.vhd_cancel_button = QtWidgets.QPushButton(t('buttons.cancel'))
         self.vhd_cancel_button.setMinimumHeight(44)
         self.vhd_cancel_button.setObjectName("actionButton")
         self.vhd_cancel_button.setStyleSheet("background-color: #d9534f; color: white;")
@@ -5494,13 +6446,13 @@ class MainWindow(QtWidgets.QWidget):
         bcd_cleanup_layout = QtWidgets.QHBoxLayout()
         bcd_cleanup_layout.addStretch()
         
-        self.bcd_cleanup_btn = QtWidgets.QPushButton(translator.t('buttons.remove_bcd_entries'))
+        self.bcd_cleanup_btn = QtWidgets.QPushButton(t('buttons.remove_bcd_entries'))
         self.bcd_cleanup_btn.setMinimumHeight(40)
         self.bcd_cleanup_btn.setObjectName("warningButton")
         self.bcd_cleanup_btn.setStyleSheet("background-color: #d9534f; color: white; font-size: 11px;")
         self.bcd_cleanup_btn.setMinimumWidth(250)
         self.bcd_cleanup_btn.clicked.connect(self.remove_bcd_entries)
-        self.bcd_cleanup_btn.setToolTip(translator.t('tooltips.remove_bcd_entries'))
+        self.bcd_cleanup_btn.setToolTip(t('tooltips.remove_bcd_entries'))
         
         bcd_cleanup_layout.addWidget(self.bcd_cleanup_btn)
         bcd_cleanup_layout.addStretch()
@@ -5513,7 +6465,7 @@ class MainWindow(QtWidgets.QWidget):
         layout.addWidget(separator)
 
         # PC Configuration section
-        config_label = QtWidgets.QLabel(translator.t('labels.system_config'))
+        config_label = QtWidgets.QLabel(t('labels.system_config'))
         config_label.setObjectName("sectionHeader")
         config_label.setStyleSheet("font-size: 13px; font-weight: bold;")
         layout.addWidget(config_label)
@@ -5529,9 +6481,9 @@ class MainWindow(QtWidgets.QWidget):
         self.vhdx_storage_label = QtWidgets.QLabel()
         self.vhdx_ram_label = QtWidgets.QLabel()
         
-        config_layout.addRow(translator.t('labels.windows_version'), self.vhdx_windows_label)
-        config_layout.addRow(translator.t('labels.free_storage'), self.vhdx_storage_label)
-        config_layout.addRow(translator.t('labels.ram'), self.vhdx_ram_label)
+        config_layout.addRow(t('labels.windows_version'), self.vhdx_windows_label)
+        config_layout.addRow(t('labels.free_storage'), self.vhdx_storage_label)
+        config_layout.addRow(t('labels.ram'), self.vhdx_ram_label)
         
         layout.addWidget(config_frame)
 
@@ -5544,12 +6496,9 @@ class MainWindow(QtWidgets.QWidget):
     def populate_vhdx_drives(self):
         """Populate the drive combo box with available drives"""
         try:
-            import string
-            from ctypes import windll
-            
             self.vhdx_disk_combo.clear()
             drives = []
-            bitmask = windll.kernel32.GetLogicalDrives()
+            bitmask = ctypes.windll.kernel32.GetLogicalDrives()
             for letter in string.ascii_uppercase:
                 if bitmask & 1:
                     drives.append(letter)
@@ -5617,7 +6566,7 @@ class MainWindow(QtWidgets.QWidget):
         
         try:
             logger.debug(f"Fetching VHDX file size from: {self.vhd_download_link}")
-            response = requests.head(self.vhd_download_link, allow_redirects=True, timeout=10)
+            response = get_http_session().head(self.vhd_download_link, allow_redirects=True, timeout=10)
             content_length = response.headers.get('Content-Length')
             
             if content_length:
@@ -5688,9 +6637,9 @@ class MainWindow(QtWidgets.QWidget):
         self.set_buttons_enabled(False)
         
         # Update footer
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText(translator.t('vhd.download.in_progress'))
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setRange(0, 1000)
             self.footer_progress.setValue(0)
             self.footer_progress.setFormat("%p%")
@@ -5722,15 +6671,20 @@ class MainWindow(QtWidgets.QWidget):
                 selected_drive
             )
         
-        self.vhdx_download_thread.progress.connect(self.update_vhdx_progress)
+        self.vhdx_download_thread.progress.connect(self.update_vhdx_progress, QtCore.Qt.ConnectionType.QueuedConnection)
         self.vhdx_download_thread.finished.connect(self.on_vhdx_download_finished)
         self.vhdx_download_thread.start()
 
     def update_vhdx_progress(self, value, speed, eta):
         """Update VHDX download progress"""
+        # Same ~20 Hz footer gate as update_progress; the final value always goes through
+        now = time.monotonic_ns()
+        if value < 1000 and now - self._progress_last_ns < self.FOOTER_REPAINT_NS:
+            return
+        self._progress_last_ns = now
         logger.debug(f"update_vhdx_progress called: value={value}, speed={speed:.2f}, eta={eta}")
         
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setValue(value)
             if speed > 0:
                 self.footer_progress.setFormat(f"{value/10:.1f}% - {speed:.2f} MB/s - ETA: {eta}")
@@ -5738,7 +6692,7 @@ class MainWindow(QtWidgets.QWidget):
                 self.footer_progress.setFormat(f"{value/10:.1f}%")
             logger.debug(f"Progress bar updated: {value/10:.1f}%")
         
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             speed_text = f"{speed:.2f} MB/s" if speed > 0 else "Connexion..."
             self.footer_label.setText(f"Vitesse: {speed_text}")
             logger.debug(f"Footer label updated: {speed_text}")
@@ -5756,9 +6710,9 @@ class MainWindow(QtWidgets.QWidget):
         self.set_buttons_enabled(True)
         
         # Update footer
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText(message)
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             if success:
                 self.footer_progress.setValue(1000)
             else:
@@ -5792,7 +6746,6 @@ class MainWindow(QtWidgets.QWidget):
         found_drive = None
         
         try:
-            import string
             # Get all available drive letters
             available_drives = []
             for letter in string.ascii_uppercase:
@@ -5844,9 +6797,9 @@ class MainWindow(QtWidgets.QWidget):
         self.set_buttons_enabled(False)
         
         # Update footer
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText("Installation VHDX en cours...")
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setRange(0, 0)  # Indeterminate
         
         # Start installation thread
@@ -5861,9 +6814,9 @@ class MainWindow(QtWidgets.QWidget):
         self.set_buttons_enabled(True)
         
         # Update footer
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText(translator.t('vhd.install.complete') if success else translator.t('vhd.install.failed'))
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setRange(0, 1000)
             self.footer_progress.setValue(1000 if success else 0)
         
@@ -5901,9 +6854,9 @@ class MainWindow(QtWidgets.QWidget):
         self.set_buttons_enabled(False)
         
         # Update footer
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText(translator.t('messages.bcd_cleanup.in_progress'))
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setRange(0, 0)  # Indeterminate
         
         # Start cleanup thread
@@ -5918,9 +6871,9 @@ class MainWindow(QtWidgets.QWidget):
         self.set_buttons_enabled(True)
         
         # Update footer
-        if hasattr(self, 'footer_label'):
+        if self.footer_label is not None:
             self.footer_label.setText(translator.t('messages.bcd_cleanup.complete') if success else translator.t('messages.bcd_cleanup.failed'))
-        if hasattr(self, 'footer_progress'):
+        if self.footer_progress is not None:
             self.footer_progress.setRange(0, 1000)
             self.footer_progress.setValue(1000 if success else 0)
         
@@ -6038,7 +6991,7 @@ class MainWindow(QtWidgets.QWidget):
             api_url = "https://api.github.com/repos/RetroGameSets/PSA-DIAG/releases?per_page=10"
             
             logger.info(f"[STEP 3] -- Fetching changelog for last 10 releases")
-            response = requests.get(api_url, timeout=15)
+            response = get_http_session().get(api_url, timeout=15, headers=GITHUB_API_HEADERS)
             
             if response.status_code == 200:
                 releases = response.json()
@@ -6059,7 +7012,6 @@ class MainWindow(QtWidgets.QWidget):
                     date_str = ''
                     if published:
                         try:
-                            from datetime import datetime
                             dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
                             date_str = dt.strftime('%Y-%m-%d')
                         except:
@@ -6259,19 +7211,18 @@ class MainWindow(QtWidgets.QWidget):
             except Exception:
                 pass
 
-        # Kill any running aria2c processes
+        # Kill any running aria2c processes: filter the snapshot first, then stop the matches
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
+            for pid in [pid for pid, name in iter_process_names() if name == 'aria2c.exe']:
+                logger.info(f"Terminating aria2c.exe (PID: {pid})")
                 try:
-                    if proc.info['name'] and proc.info['name'].lower() == 'aria2c.exe':
-                        logger.info(f"Terminating aria2c.exe (PID: {proc.pid})")
-                        try:
-                            proc.terminate()
-                            proc.wait(timeout=2)
-                        except Exception:
-                            proc.kill()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    proc = psutil.Process(pid)
+                    proc.terminate()
+                    proc.wait(timeout=2)
+                except psutil.NoSuchProcess:
                     pass
+                except Exception:
+                    terminate_pid(pid)
         except Exception as e:
             logger.error(f"Error killing aria2c processes: {e}")
 
@@ -6301,6 +7252,11 @@ class MainWindow(QtWidgets.QWidget):
             except Exception:
                 pass
 
+        try:
+            close_http_session()
+        except Exception:
+            pass
+
         logger.info("Cleanup before exit finished")
 
 
@@ -0,0 +1,48 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+        self.headers = {'ETag': '"abc"'}
+
+    def raise_for_status(self):
+        pass
+
+
+PAYLOAD = {"version": "2.3.1.0", "message": "Mise à jour"}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, '_remote_json_cache', {})
+    monkeypatch.setattr(main, '_remote_cache_path', lambda url: tmp_path / 'entry.json')
+    return tmp_path
+
+
+@pytest.mark.parametrize('raw', [
+    b'\xef\xbb\xbf' + json.dumps(PAYLOAD).encode('utf-8'),
+    json.dumps(PAYLOAD).encode('utf-16'),
+    json.dumps(PAYLOAD).encode('utf-16-le'),
+    json.dumps(PAYLOAD).encode('utf-32'),
+], ids=['utf-8-bom', 'utf-16-bom', 'utf-16-le', 'utf-32-bom'])
+def test_apply_remote_response_accepts_bom_and_utf16(cache_dir, raw):
+    url = 'https://example.invalid/data.json'
+    assert main._apply_remote_response(url, None, FakeResponse(raw)) == PAYLOAD
+
+    # The disk copy must parse back to the same data on the next launch
+    main._remote_json_cache.clear()
+    entry = main._load_remote_cache_entry(url)
+    assert entry['data'] == PAYLOAD
+    assert entry['etag'] == '"abc"'